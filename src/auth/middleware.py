@@ -4,6 +4,9 @@ from botbuilder.core import TurnContext
 from src.auth.manager import AuthManager, Permission
 from src.log.system_logger import Logger, get_system_logger
 
+# turn_state key under which the authorized user's info is cached for the rest of the turn
+USER_INFO_KEY: str = "auth_user_info"
+
 class AuthMiddleware:
     """
     Authentication middleware that runs before processing messages.
@@ -41,6 +44,8 @@ class AuthMiddleware:
         """
         Processes the message and verifies authentication and authorization.
 
+        On success, the user's information is cached in the turn state for `get_user_info`.
+
         Args:
             context (TurnContext): The turn context for the current message.
             required_permission (Permission, optional): The permission required for the action. Defaults to None.
@@ -79,6 +84,7 @@ class AuthMiddleware:
                 return False, error_msg
             
             self.system_logger.debug(f"User authorized {auth_user.name} with role {auth_user.role.value}")
+            context.turn_state[USER_INFO_KEY] = auth_user.to_dict()
             return True, None
             
         except Exception as e:
@@ -90,6 +96,9 @@ class AuthMiddleware:
         """
         Retrieves the authenticated user's information.
 
+        Returns the info cached on the turn by a successful `process_message` call
+        when available, so each turn resolves the user only once.
+
         Args:
             turn_context (TurnContext): The turn context for the current message.
             
@@ -97,6 +106,10 @@ class AuthMiddleware:
             Optional[Dict]: A dictionary containing user information if authenticated, otherwise None.
         """
         try:
+            user_info: Optional[Dict] = turn_context.turn_state.get(USER_INFO_KEY)
+            if user_info is not None:
+                return user_info
+
             user_id = turn_context.activity.from_property.id
             auth_user = self.auth_manager.get_authenticated_user(user_id)
             
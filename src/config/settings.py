@@ -60,6 +60,8 @@ class Settings(BaseSettings):
     ref_sync_path: str = Field(default="./data/ref_sync_data.json")
     doc_meta_path: str = Field(default="./data/doc_meta_data.json")
     ref_meta_path: str = Field(default="./data/ref_meta_data.json")
+    vector_store_health_path: str = Field(default="./data/vector_store_health.json")
+    vector_store_health_ttl: int = Field(default=3600)
 
     # --- Stats Configuration ---
     stats_file_path: str = Field(default="./data/stats/usage_stats.csv")
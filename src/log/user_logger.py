@@ -1,5 +1,6 @@
 
 import os
+import logging
 
 from typing import Optional, List, Dict
 from logging import Logger, Formatter
@@ -156,6 +157,9 @@ def get_user_logger(user_id: str, user_name: str) -> Logger:
     """
     Convenience function to get a UserLogger instance.
 
+    A logger that is already configured is returned as is, without reloading
+    the excluded users file.
+
     Args:
         user_id (str): The unique identifier of the user.
         user_name (str): The name of the user.
@@ -163,4 +167,7 @@ def get_user_logger(user_id: str, user_name: str) -> Logger:
     Returns:
         Logger: A configured UserLogger instance.
     """
+    logger: Logger = logging.getLogger(f"user_logs.{user_id}")
+    if logger.handlers:
+        return logger
     return UserLogger(user_id, user_name).get_logger()
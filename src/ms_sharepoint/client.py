@@ -1,11 +1,98 @@
 import os
+import re
 import time
+import queue
+import shutil
+import asyncio
+import threading
+import aiohttp
+import orjson
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import BytesIO
-from typing_extensions import Dict, List, Optional, Any, Union
+from urllib.parse import urlparse, quote
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+from typing_extensions import Dict, List, Optional, Any, Union, Iterable, Iterator, Deque, Tuple, Set
 
 from src.log.system_logger import Logger, get_system_logger
 
+try:
+    import brotli # noqa: F401 (lets urllib3 decode 'br' encoded responses)
+    ACCEPT_ENCODING: str = 'br, gzip, deflate'
+except ImportError:
+    ACCEPT_ENCODING: str = 'gzip, deflate'
+
+DOWNLOAD_CHUNK_SIZE: int = 1 << 20
+SPOOLED_MAX_SIZE: int = 8 << 20
+DOWNLOAD_QUEUE_SIZE: int = 32
+DOWNLOAD_QUEUE_PUT_TIMEOUT: float = 0.5 # Producers re-check the cancel event at this interval
+SIMPLE_UPLOAD_MAX_SIZE: int = 4 * 1024 * 1024
+UPLOAD_CHUNK_SIZE: int = 10 * 1024 * 1024 # Must be a multiple of 320 KiB
+GRAPH_HOST: str = "graph.microsoft.com"
+GRAPH_BASE_URL: str = f"https://{GRAPH_HOST}/v1.0"
+DOWNLOAD_POOL_MAXSIZE: int = 64
+GRAPH_POOL_CONNECTIONS: int = 32
+GRAPH_POOL_MAXSIZE: int = 100
+AIO_CONNECTION_LIMIT: int = 100
+AIO_KEEPALIVE_TIMEOUT: int = 30
+ITEM_ID_CACHE_SIZE: int = 1024
+ITEM_ID_CACHE_TTL: int = 300
+AIO_SEARCH_CONCURRENCY: int = 20 # Graph requests in flight at once during an async search run
+AIO_MAX_RETRIES: int = 5
+AIO_RETRY_STATUSES: frozenset = frozenset([429, 500, 502, 503, 504])
+GRAPH_BATCH_MAX_REQUESTS: int = 20 # Hard limit of the Graph $batch endpoint
+GRAPH_BATCH_MAX_RETRIES: int = 5
+# Statuses for which Graph guarantees a POST was rejected without being processed
+GRAPH_POST_RETRY_STATUSES: frozenset = frozenset([429, 503])
+
+class _GraphRetry(Retry):
+    """
+    Transport retry policy for Graph requests.
+
+    Idempotent methods are retried on throttling and transient server errors. POST
+    requests (folder creation, upload sessions, `$batch`) are only retried when Graph
+    rejected them outright, so a request that may have been applied is never re-sent.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        """
+        Checks whether a response status should be retried for the given method.
+
+        Args:
+            method (str): The HTTP method of the request.
+            status_code (int): The response status code.
+            has_retry_after (bool, optional): Whether the response has a Retry-After header. Defaults to False.
+
+        Returns:
+            bool: `True` if the request should be retried, otherwise `False`.
+        """
+        if method.upper() == 'POST':
+            return bool(self.total) and status_code in GRAPH_POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+# Transport-level retries for throttling (429) and transient server errors, honoring Retry-After.
+# Read errors are only retried for idempotent methods; backoff adds at most ~7s per request (plus any Retry-After).
+GRAPH_RETRY: Retry = _GraphRetry(
+    total=4,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'PUT', 'DELETE']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+# Only the fields read by `_build_item_info`, with the largest page size Graph allows
+FOLDER_CONTENT_QUERY: str = (
+    "$expand=listItem($expand=fields)"
+    "&$select=id,name,size,file,folder,createdDateTime,lastModifiedDateTime,webUrl,@microsoft.graph.downloadUrl"
+    "&$top=999"
+)
+# Fields returned by drive searches
+SEARCH_SELECT: str = "id,name,parentReference,file,folder,size,lastModifiedDateTime,webUrl"
+
 class SharePointClient:
     """
     Represents a client for interacting with the SharePoint API.
@@ -28,8 +115,15 @@ class SharePointClient:
         resource_url (str): The base URL for the Microsoft Graph API.
         base_url (str): The token endpoint URL for authentication.
         headers (Dict[str, str]): The HTTP headers for token requests.
-        access_token_expiration (Optional[float]): The timestamp when the current access token expires.
+        access_token_expiration (Optional[float]): The monotonic clock time at which the current access token expires.
         access_token (Optional[str]): The active access token for API requests.
+        _token_lock (threading.Lock): Serializes token renewal across threads.
+        _auth_header (Dict[str, str]): Cached Authorization header for the current access token.
+        _session (requests.Session): Shared HTTP session reused across requests (connection keep-alive),
+                                     retrying throttled and transient failures with exponential backoff.
+        _download_session (requests.Session): Separate unauthenticated session for pre-signed download URLs.
+        _created_dirs (Set[str]): Local directories already created during the current download run.
+        _item_id_cache (TTLCache): Item IDs resolved by path, keyed by (site_id, drive_id, path).
     """
     def __init__(self, tenant_id: str, client_id: str, client_secret: str, resource_url: str = "https://graph.microsoft.com/"):
         """
@@ -49,7 +143,19 @@ class SharePointClient:
         self.base_url: str = f"https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/token"
         self.headers: str = {'Content-Type': 'application/x-www-form-urlencoded'}
         self.access_token_expiration: Optional[float] = None
+        self._token_lock: threading.Lock = threading.Lock()
         self.access_token: Optional[str] = self.get_access_token()
+        self._auth_header: Dict[str, str] = {'Authorization': f'Bearer {self.access_token}'}
+        self._session: requests.Session = requests.Session()
+        self._session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        self._session.mount('https://', HTTPAdapter(pool_connections=GRAPH_POOL_CONNECTIONS, pool_maxsize=GRAPH_POOL_MAXSIZE, max_retries=GRAPH_RETRY))
+        # Pre-signed download URLs live on other hosts and never receive the bearer token
+        self._download_session: requests.Session = requests.Session()
+        self._download_session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        self._download_session.mount('https://', HTTPAdapter(pool_maxsize=DOWNLOAD_POOL_MAXSIZE, max_retries=GRAPH_RETRY))
+        self._created_dirs: Set[str] = set()
+        self._item_id_cache: TTLCache = TTLCache(maxsize=ITEM_ID_CACHE_SIZE, ttl=ITEM_ID_CACHE_TTL)
+        self._item_id_lock: threading.Lock = threading.Lock()
 
     def get_access_token(self) -> Optional[str]:
         """
@@ -69,26 +175,59 @@ class SharePointClient:
         }
         response: requests.Response = requests.post(self.base_url, headers=self.headers, data=body)
         response.raise_for_status() 
-        token_data: Dict[str, Any] = response.json()
-        self.access_token_expiration = time.time() + token_data.get('expires_in', 3600) - 300
+        token_data: Dict[str, Any] = self._json(response)
+        self.access_token_expiration = time.monotonic() + token_data.get('expires_in', 3600) - 300
         return token_data.get('access_token')
     
+    @staticmethod
+    def _json(response: requests.Response) -> Any:
+        """
+        Decodes a JSON response body with orjson, working directly on the raw bytes.
+
+        Args:
+            response (requests.Response): The response to decode.
+
+        Returns:
+            Any: The decoded JSON document.
+        """
+        return orjson.loads(response.content)
+
     def _ensure_access_token_valid(self) -> None:
         """
         Checks if the current access token is valid and refreshes it if it's expired or near expiration.
 
         This is a private helper method that ensures all API calls are made with a valid token,
-        automatically handling token renewal to prevent authentication failures.
+        automatically handling token renewal to prevent authentication failures. The common case
+        (a valid token) is a lock-free check; renewal is done under a lock with a second check,
+        so concurrent callers that detect expiration trigger a single token request.
 
-        Returns:
-            bool: True if the token is valid, False otherwise.
+        Raises:
+            Exception: If the access token cannot be renewed.
         """
-        if not hasattr(self, 'access_token_expiration') or time.time() >= self.access_token_expiration:
+        if self.access_token_expiration is not None and time.monotonic() < self.access_token_expiration:
+            return
+
+        with self._token_lock:
+            if self.access_token_expiration is not None and time.monotonic() < self.access_token_expiration:
+                return
             self.system_logger.debug("Access token expired or near expiration. Renewing...")
-            self.access_token = self.get_access_token()
-            if not self.access_token:
+            access_token: Optional[str] = self.get_access_token()
+            if not access_token:
                 self.system_logger.error("Failed to renew access token.")
                 raise Exception("Failed to renew access token.")
+            self.access_token = access_token
+            self._auth_header = {'Authorization': f'Bearer {access_token}'}
+
+    async def _aensure_access_token_valid(self) -> None:
+        """
+        Asynchronous counterpart of `_ensure_access_token_valid`.
+
+        A valid token is checked inline; the blocking renewal request runs in a worker
+        thread so it does not stall the event loop.
+        """
+        if self.access_token_expiration is not None and time.monotonic() < self.access_token_expiration:
+            return
+        await asyncio.to_thread(self._ensure_access_token_valid)
 
     def get_site_id(self, site_url: str) -> str:
         """
@@ -102,8 +241,8 @@ class SharePointClient:
         """
         self._ensure_access_token_valid()
         full_url: str = f'https://graph.microsoft.com/v1.0/sites/{site_url}'
-        response: requests.Response = requests.get(full_url, headers={'Authorization': f'Bearer {self.access_token}'})
-        return response.json().get('id')
+        response: requests.Response = self._session.get(full_url, headers=self._auth_header)
+        return self._json(response).get('id')
 
     def get_drives_id(self, site_id: str) -> Dict[str,str]:
         """
@@ -119,15 +258,15 @@ class SharePointClient:
             Dict[str, str]: A dictionary mapping drive names to their IDs.
         """
         self._ensure_access_token_valid()
-        drives_url: str = f'https://graph.microsoft.com/v1.0/sites/{site_id}/drives'
-        headers: Dict[str, str] = {'Authorization': f'Bearer {self.access_token}'}
-        response: requests.Response = requests.get(drives_url, headers=headers)
+        drives_url: str = f'https://graph.microsoft.com/v1.0/sites/{site_id}/drives?$select=id,name'
+        headers: Dict[str, str] = self._auth_header
+        response: requests.Response = self._session.get(drives_url, headers=headers)
         
         if response.status_code != 200:
             self.system_logger.error(f"Error getting drives: {response.status_code} - {response.text}")
             return {}
 
-        drives_data: List[Dict[str, Any]] = response.json().get('value', [])
+        drives_data: List[Dict[str, Any]] = self._json(response).get('value', [])
     
         drives_by_name: Dict[str, str] = {drive['name']: drive['id'] for drive in drives_data}
         
@@ -138,7 +277,8 @@ class SharePointClient:
         Retrieves the ID of a file or folder from its path within a drive.
 
         This method uses a path-based approach to get the unique identifier of an item,
-        which is necessary for many Graph API operations.
+        which is necessary for many Graph API operations. Resolved IDs are cached for
+        5 minutes, so repeated searches over the same paths skip the request.
 
         Args:
             site_id (str): The ID of the SharePoint site.
@@ -149,26 +289,28 @@ class SharePointClient:
         Returns:
             Optional[str]: The ID of the item if found, otherwise None.
         """
+        cached_item_id: Optional[str] = self._get_cached_item_id(site_id, drive_id, path)
+        if cached_item_id:
+            return cached_item_id
+
         self._ensure_access_token_valid()
         
-        normalized_path = os.path.normpath(path).strip('/')
+        item_by_path_url: Optional[str] = self._item_by_path_url(site_id, drive_id, path)
         
-        if not normalized_path:
+        if not item_by_path_url:
             return drive_id
 
-        # Construct the API URL using the item's path
-        # The syntax ':/{path}:' is a special way to address items by path in the Graph API
-        item_by_path_url: str = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drives/{drive_id}/root:/{normalized_path}"
-        headers: Dict[str, str] = {'Authorization': f'Bearer {self.access_token}'}
+        headers: Dict[str, str] = self._auth_header
         
         try:
-            response: requests.Response = requests.get(item_by_path_url, headers=headers)
+            response: requests.Response = self._session.get(item_by_path_url, headers=headers)
             response.raise_for_status()
             
-            item_metadata: Dict[str, Any] = response.json()
+            item_metadata: Dict[str, Any] = self._json(response)
             item_id: str = item_metadata.get('id')
             
             if item_id:
+                self._cache_item_id(site_id, drive_id, path, item_id)
                 return item_id
             else:
                 self.system_logger.warning(f"ID not found in the response for path '{path}'.")
@@ -185,6 +327,94 @@ class SharePointClient:
             self.system_logger.error(f"An unexpected error occurred: {e}")
             return None
         
+    def get_item_ids(self, site_id: str, drive_id: str, paths: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Retrieves the IDs of several files or folders from their paths, resolving up to
+        20 paths per HTTP round trip through the Graph `$batch` endpoint. Paths resolved
+        within the last 5 minutes are served from the item ID cache.
+
+        Args:
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            paths (List[str]): The paths to the items, relative to the drive's root.
+
+        Returns:
+            Dict[str, Optional[str]]: A dictionary mapping each path to its item ID, or None if not found.
+        """
+        item_ids: Dict[str, Optional[str]] = {}
+        batch_paths: List[str] = []
+        batch_urls: List[str] = []
+
+        for path in paths:
+            cached_item_id: Optional[str] = self._get_cached_item_id(site_id, drive_id, path)
+            if cached_item_id:
+                item_ids[path] = cached_item_id
+                continue
+
+            item_by_path_url: Optional[str] = self._item_by_path_url(site_id, drive_id, path)
+            if not item_by_path_url:
+                item_ids[path] = drive_id
+                continue
+            batch_paths.append(path)
+            batch_urls.append(f"{item_by_path_url}?$select=id")
+
+        for path, item_metadata in zip(batch_paths, self._batch_get(batch_urls)):
+            item_ids[path] = item_metadata.get('id') if item_metadata else None
+            self._cache_item_id(site_id, drive_id, path, item_ids[path])
+            if not item_ids[path]:
+                self.system_logger.warning(f"Item not found at path '{path}'.")
+
+        return item_ids
+
+    def _get_cached_item_id(self, site_id: str, drive_id: str, path: str) -> Optional[str]:
+        """
+        Looks up an item ID previously resolved by path.
+
+        Args:
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            path (str): The path to the item, relative to the drive's root.
+
+        Returns:
+            Optional[str]: The cached item ID, or None if missing or expired.
+        """
+        with self._item_id_lock:
+            return self._item_id_cache.get((site_id, drive_id, path))
+
+    def _cache_item_id(self, site_id: str, drive_id: str, path: str, item_id: Optional[str]) -> None:
+        """
+        Stores a resolved item ID. Failed lookups (None) are not cached.
+
+        Args:
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            path (str): The path to the item, relative to the drive's root.
+            item_id (Optional[str]): The resolved item ID.
+        """
+        if item_id:
+            with self._item_id_lock:
+                self._item_id_cache[(site_id, drive_id, path)] = item_id
+
+    @staticmethod
+    def _item_by_path_url(site_id: str, drive_id: str, path: str) -> Optional[str]:
+        """
+        Builds the URL addressing an item by its path within a drive.
+
+        The syntax ':/{path}' is a special way to address items by path in the Graph API.
+
+        Args:
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            path (str): The path to the item, relative to the drive's root.
+
+        Returns:
+            Optional[str]: The URL of the item, or None if the path points to the drive's root.
+        """
+        normalized_path: str = os.path.normpath(path).strip('/')
+        if not normalized_path or normalized_path == '.':
+            return None
+        return f"{GRAPH_BASE_URL}/sites/{site_id}/drives/{drive_id}/root:/{quote(normalized_path, safe='/')}"
+        
     def get_lists_id(self, site_id: str) -> Dict[str, str]:
         """
         Fetches all list IDs and display names within a site.
@@ -199,15 +429,15 @@ class SharePointClient:
             Dict[str, str]: A dictionary mapping list display names to their IDs.
         """
         self._ensure_access_token_valid()
-        lists_url: str = f'https://graph.microsoft.com/v1.0/sites/{site_id}/lists'
-        headers: Dict[str, str] = {'Authorization': f'Bearer {self.access_token}'}
-        response: requests.Response = requests.get(lists_url, headers=headers)
+        lists_url: str = f'https://graph.microsoft.com/v1.0/sites/{site_id}/lists?$select=id,displayName'
+        headers: Dict[str, str] = self._auth_header
+        response: requests.Response = self._session.get(lists_url, headers=headers)
         
         if response.status_code != 200:
             self.system_logger.error(f"Error getting lists: {response.status_code} - {response.text}")
             return {}
 
-        lists_data: List[Dict[str, Any]] = response.json().get('value', [])
+        lists_data: List[Dict[str, Any]] = self._json(response).get('value', [])
     
         lists_by_name: Dict[str, str] = {lst['displayName']: lst['id'] for lst in lists_data}
         
@@ -229,53 +459,90 @@ class SharePointClient:
         Returns:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary represents a file or folder.
         """
+        return list(self.iter_folder_content(site_id, drive_id, folder_id, path))
+
+    def iter_folder_content(self, site_id: str, drive_id: str, folder_id: str = "root", path: str = "") -> Iterator[Dict[str, Any]]:
+        """
+        Generator version of `get_folder_content`, yielding items as each page arrives from Graph.
+
+        Args:
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            folder_id (str, optional): The ID of the folder to list contents from. Defaults to "root".
+            path (str, optional): The current path for building the fullPath. Used internally.
+
+        Yields:
+            Dict[str, Any]: A dictionary representing a file or folder.
+        """
         self._ensure_access_token_valid()
-        folder_contents_url: str = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drives/{drive_id}/items/{folder_id}/children?$expand=listItem"
-        contents_headers: Dict[str, str] = {'Authorization': f'Bearer {self.access_token}'}
+        folder_contents_url: str = self._folder_content_url(site_id, drive_id, folder_id)
+        contents_headers: Dict[str, str] = self._auth_header
         
-        items_list: List[Dict[str, Any]] = []
+        path_prefix: str = self._path_prefix(path)
 
         while folder_contents_url:
-            contents_response: requests.Response = requests.get(folder_contents_url, headers=contents_headers)
+            contents_response: requests.Response = self._session.get(folder_contents_url, headers=contents_headers)
             if contents_response.status_code != 200:
                 self.system_logger.error(f"Error fetching folder contents: {contents_response.status_code} - {contents_response.text}")
-                return []
+                return
 
-            folder_contents: Dict[str, Any] = contents_response.json()
+            folder_contents: Dict[str, Any] = self._json(contents_response)
 
             for item in folder_contents.get('value', []):
-                item_path: str = f"{path}/{item['name']}".strip('/')
-                extension: Optional[str] = None
-                fields: Optional[str] = None
-
-                if 'file' in item: 
-                    extension = os.path.splitext(item['name'])[1].lstrip('.')
-                    if not extension: 
-                        extension = None 
-
-                if 'listItem' in item:
-                    fields = item['listItem']['fields']
-
-                item_info: Dict[str, Any] = {
-                    'id': item['id'],
-                    'name': item['name'],
-                    'type': 'Folder' if 'folder' in item else 'File',
-                    'extension': extension,
-                    'size': item.get('size', 0),
-                    'created': item.get('createdDateTime', None),
-                    'lastModified': item.get('lastModifiedDateTime', None),
-                    'mimeType': item['file']['mimeType'] if 'file' in item else None,
-                    'downloadUrl': item.get('@microsoft.graph.downloadUrl', None),
-                    'webUrl': item.get('webUrl', None),
-                    'path': path,
-                    'fullPath': item_path,
-                    'fields': fields
-                }
-                items_list.append(item_info)
+                yield self._build_item_info(item, path, path_prefix)
             
             folder_contents_url = folder_contents.get('@odata.nextLink', None)
 
-        return items_list
+    @staticmethod
+    def _path_prefix(path: str) -> str:
+        """
+        Returns the prefix prepended to item names to build their fullPath.
+
+        Args:
+            path (str): The path of the folder that contains the items.
+
+        Returns:
+            str: The folder path without surrounding slashes followed by '/', or '' for the root.
+        """
+        path = path.strip('/')
+        return path + '/' if path else ''
+
+    @staticmethod
+    def _build_item_info(item: Dict[str, Any], path: str, path_prefix: str) -> Dict[str, Any]:
+        """
+        Converts a raw Graph API drive item into the flat dictionary used across the application.
+
+        Args:
+            item (Dict[str, Any]): The raw drive item as returned by the Graph API.
+            path (str): The path of the folder that contains the item.
+            path_prefix (str): The value of `_path_prefix(path)`, computed once per folder page.
+
+        Returns:
+            Dict[str, Any]: A dictionary with the item's details, including its full path.
+        """
+        name: str = item['name']
+        item_file: Optional[Dict[str, Any]] = item.get('file')
+        extension: Optional[str] = None
+        list_item: Optional[Dict[str, Any]] = item.get('listItem')
+
+        if item_file is not None:
+            extension = os.path.splitext(name)[1].lstrip('.') or None
+
+        return {
+            'id': item['id'],
+            'name': name,
+            'type': 'Folder' if 'folder' in item else 'File',
+            'extension': extension,
+            'size': item.get('size', 0),
+            'created': item.get('createdDateTime'),
+            'lastModified': item.get('lastModifiedDateTime'),
+            'mimeType': item_file['mimeType'] if item_file is not None else None,
+            'downloadUrl': item.get('@microsoft.graph.downloadUrl'),
+            'webUrl': item.get('webUrl'),
+            'path': path,
+            'fullPath': path_prefix + name,
+            'fields': list_item['fields'] if list_item is not None else None
+        }
     
     def deep_folder_contents(self, site_id: str, drive_id: str, folder_id: str = "root", current_path: str = "", blacklist_paths: List[str] = None, keywords_to_skip: List[str] = None) -> List[Dict[str, Any]]:
         """
@@ -290,8 +557,8 @@ class SharePointClient:
             drive_id (str): The ID of the drive within the site.
             folder_id (str, optional): The ID of the folder to start the search from.
                                         Defaults to "root" (the drive's root folder).
-            current_path (str, optional): The current path for building fullPath.
-                                            Used internally for recursion.
+            current_path (str, optional): The path of the starting folder, used
+                                            as prefix when building fullPath.
             blacklist_paths (List[str], optional): A list of full paths (case-insensitive)
                                                     to folders that should be skipped.
                                                     Defaults to None.
@@ -303,42 +570,196 @@ class SharePointClient:
             list: A list of dictionaries, where each dictionary represents a file or folder
                     with its details, including the full path.
         """
-        if blacklist_paths is None:
-            blacklist_paths = []
-        
-        if keywords_to_skip is None:
-            keywords_to_skip = []
-        
-        norm_blacklist_paths: List[str] = [os.path.normpath(p).lower() for p in blacklist_paths]
-        norm_keywords_to_skip: List[str] = [keyword.lower() for keyword in keywords_to_skip]
+        return list(self.iter_deep_folder_contents(site_id, drive_id, folder_id, current_path, blacklist_paths, keywords_to_skip))
 
-        all_items: List[Dict[str, Any]] = []
+    def iter_deep_folder_contents(self, site_id: str, drive_id: str, folder_id: str = "root", current_path: str = "", blacklist_paths: List[str] = None, keywords_to_skip: List[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Generator version of `deep_folder_contents`, yielding items while the tree is still
+        being listed so callers can start processing them before enumeration completes.
+
+        Args:
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            folder_id (str, optional): The ID of the folder to start the search from. Defaults to "root".
+            current_path (str, optional): The path of the starting folder, used as prefix when building fullPath.
+            blacklist_paths (List[str], optional): A list of full paths (case-insensitive) to folders that should be skipped.
+            keywords_to_skip (List[str], optional): A list of keywords (case-insensitive) to skip in folder or file names.
+
+        Yields:
+            Dict[str, Any]: A dictionary representing a file or folder.
+        """
+        blacklist_re: Optional[re.Pattern] = self._compile_filter(self._normalize_path(p) for p in blacklist_paths or [])
+        keywords_re: Optional[re.Pattern] = self._compile_filter(keyword.lower() for keyword in keywords_to_skip or [])
+
+        return self._iter_deep_folder_contents(site_id, drive_id, folder_id, current_path, blacklist_re, keywords_re)
+
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        """
+        Normalizes a SharePoint path to the form used in `fullPath`: forward slashes,
+        no leading or trailing slash, lowercase.
+
+        Args:
+            path (str): The path to normalize.
+
+        Returns:
+            str: The normalized path.
+        """
+        return path.replace('\\', '/').strip('/').lower()
+
+    @staticmethod
+    def _compile_filter(terms: Iterable[str]) -> Optional[re.Pattern]:
+        """
+        Compiles a set of literal substrings into a single alternation regex.
+
+        Args:
+            terms (Iterable[str]): The already normalized substrings to match.
+
+        Returns:
+            Optional[re.Pattern]: The compiled pattern, or None if there are no terms.
+        """
+        escaped_terms: List[str] = [re.escape(term) for term in terms if term]
+        if not escaped_terms:
+            return None
+        return re.compile('|'.join(escaped_terms))
+
+    def _skip_item(self, item: Dict[str, Any], blacklist_re: Optional[re.Pattern], keywords_re: Optional[re.Pattern]) -> bool:
+        """
+        Checks whether an item matches the keyword or blacklist filters.
+
+        Args:
+            item (Dict[str, Any]): The item to check.
+            blacklist_re (Optional[re.Pattern]): Compiled blacklist paths.
+            keywords_re (Optional[re.Pattern]): Compiled keywords to skip.
+
+        Returns:
+            bool: True if the item must be skipped, otherwise False.
+        """
+        if (keywords_re and keywords_re.search(item['name'].lower())) or (blacklist_re and blacklist_re.search(item['fullPath'].lower())):
+            self.system_logger.debug(f"Skipping item/folder: {item['fullPath']}")
+            return True
+        return False
+
+    def _iter_deep_folder_contents(self, site_id: str, drive_id: str, folder_id: str, current_path: str, blacklist_re: Optional[re.Pattern], keywords_re: Optional[re.Pattern]) -> Iterator[Dict[str, Any]]:
+        """
+        Iterative (breadth-first) generator behind `iter_deep_folder_contents` receiving the precompiled filters.
+
+        Pending folder listings (and their follow-up pages) are kept in a work queue and
+        fetched in groups of up to 20 through the Graph `$batch` endpoint.
 
-        norm_current_path = os.path.normpath(current_path).lower()
-        if any(norm_current_path.startswith(bl_path) for bl_path in norm_blacklist_paths):
+        Args:
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            folder_id (str): The ID of the folder to start from.
+            current_path (str): The path of the starting folder.
+            blacklist_re (Optional[re.Pattern]): Compiled blacklist paths.
+            keywords_re (Optional[re.Pattern]): Compiled keywords to skip.
+
+        Yields:
+            Dict[str, Any]: A dictionary representing a file or folder.
+        """
+        if blacklist_re and blacklist_re.match(self._normalize_path(current_path)):
             self.system_logger.debug(f"Skipping blacklisted folder path: {current_path}")
-            return []
+            return
 
-        current_folder_items: List[Dict[str, Any]] = self.get_folder_content(site_id, drive_id, folder_id, current_path)
-        
-        for item in current_folder_items:
-            norm_item_path: str = os.path.normpath(item['fullPath'])
-            item_name_lower: str = item['name'].lower()
+        # Each entry is a page URL (first page or @odata.nextLink) and the path of its folder
+        pending_pages: Deque[Tuple[str, str]] = deque([(self._folder_content_url(site_id, drive_id, folder_id), current_path)])
 
-            if any(keyword in item_name_lower for keyword in norm_keywords_to_skip) or any(bl_path in norm_item_path.lower() for bl_path in norm_blacklist_paths):
-                self.system_logger.debug(f"Skipping item/folder: {item['fullPath']}")
-                continue
+        while pending_pages:
+            batch: List[Tuple[str, str]] = [pending_pages.popleft() for _ in range(min(GRAPH_BATCH_MAX_REQUESTS, len(pending_pages)))]
+            pages: List[Optional[Dict[str, Any]]] = self._batch_get([url for url, _ in batch])
 
-            all_items.append(item)
+            for (_, path), folder_contents in zip(batch, pages):
+                if folder_contents is None:
+                    continue
 
-            if item['type'] == 'Folder':
-                next_path: str = f"{current_path}/{item['name']}".strip('/')
-                subfolder_items: List[Dict[str, Any]] = self.deep_folder_contents(
-                    site_id, drive_id, item['id'], next_path, blacklist_paths, keywords_to_skip
-                )
-                all_items.extend(subfolder_items)
+                path_prefix: str = self._path_prefix(path)
+                for raw_item in folder_contents.get('value', []):
+                    item: Dict[str, Any] = self._build_item_info(raw_item, path, path_prefix)
+                    if self._skip_item(item, blacklist_re, keywords_re):
+                        continue
 
-        return all_items
+                    yield item
+
+                    if item['type'] == 'Folder':
+                        pending_pages.append((self._folder_content_url(site_id, drive_id, item['id']), item['fullPath']))
+
+                next_link: Optional[str] = folder_contents.get('@odata.nextLink')
+                if next_link:
+                    pending_pages.append((next_link, path))
+
+    @staticmethod
+    def _folder_content_url(site_id: str, drive_id: str, folder_id: str) -> str:
+        """
+        Builds the URL listing the direct children of a folder.
+
+        Args:
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            folder_id (str): The ID of the folder.
+
+        Returns:
+            str: The Graph API URL of the folder's first page of children.
+        """
+        return f"{GRAPH_BASE_URL}/sites/{site_id}/drives/{drive_id}/items/{folder_id}/children?{FOLDER_CONTENT_QUERY}"
+
+    def _batch_get(self, urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Performs several GET requests through the Graph `$batch` endpoint, 20 per HTTP round trip.
+
+        Sub-requests throttled by Graph (429/503/504) are re-sent after waiting for the
+        largest `Retry-After` reported in the batch.
+
+        Args:
+            urls (List[str]): Absolute Graph API URLs to fetch.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: The response body of each URL, in the same order,
+            or None for the requests that failed.
+        """
+        self._ensure_access_token_valid()
+        batch_url: str = f"{GRAPH_BASE_URL}/$batch"
+        headers: Dict[str, str] = {**self._auth_header, 'Content-Type': 'application/json'}
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+
+        for offset in range(0, len(urls), GRAPH_BATCH_MAX_REQUESTS):
+            pending: Dict[str, str] = {str(i): urls[i] for i in range(offset, min(offset + GRAPH_BATCH_MAX_REQUESTS, len(urls)))}
+
+            for attempt in range(GRAPH_BATCH_MAX_RETRIES):
+                body: Dict[str, Any] = {
+                    "requests": [
+                        {"id": request_id, "method": "GET", "url": url.removeprefix(GRAPH_BASE_URL)}
+                        for request_id, url in pending.items()
+                    ]
+                }
+                response: requests.Response = self._session.post(batch_url, headers=headers, json=body)
+                if response.status_code != 200:
+                    self.system_logger.error(f"Error executing batch request: {response.status_code} - {response.text}")
+                    break
+
+                retry_after: int = 0
+                for sub_response in self._json(response).get('responses', []):
+                    request_id: str = sub_response['id']
+                    status: int = sub_response.get('status', 0)
+                    if status == 200:
+                        results[int(request_id)] = sub_response.get('body')
+                        pending.pop(request_id, None)
+                    elif status in (429, 503, 504):
+                        sub_retry_after: str = sub_response.get('headers', {}).get('Retry-After', str(2 ** attempt))
+                        retry_after = max(retry_after, int(sub_retry_after))
+                    else:
+                        self.system_logger.error(f"Error in batch request '{pending[request_id]}': {status} - {sub_response.get('body')}")
+                        pending.pop(request_id, None)
+
+                if not pending:
+                    break
+                self.system_logger.warning(f"{len(pending)} batch requests throttled. Retrying in {retry_after}s.")
+                time.sleep(retry_after)
+
+            for url in pending.values():
+                self.system_logger.error(f"Batch request failed after retries: {url}")
+
+        return results
     
     def get_item_metadata(self, site_id: str, drive_id: str, item_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -355,47 +776,75 @@ class SharePointClient:
         """
         self._ensure_access_token_valid()
         item_metadata_url: str = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drives/{drive_id}/items/{item_id}?$expand=listItem"
-        headers: Dict[str, str] = {'Authorization': f'Bearer {self.access_token}'}
-        response: requests.Response = requests.get(item_metadata_url, headers=headers)
+        headers: Dict[str, str] = self._auth_header
+        response: requests.Response = self._session.get(item_metadata_url, headers=headers)
         if response.status_code == 200:
-            return response.json()
+            return self._json(response)
         else:
             self.system_logger.error(f"Error retrieving item metadata: {response.status_code} - {response.text}")
             return None
     
-    def get_file_content(self, site_id: str, drive_id: str, file_id: str) -> Optional[BytesIO]:
+    def get_file_content(self, site_id: str, drive_id: str, file_id: str, stream: bool = False) -> Optional[Union[BytesIO, SpooledTemporaryFile]]:
         """
         Retrieves a file from SharePoint and loads it into memory.
 
         This method uses the item's ID to fetch its content, which is then stored
-        in a BytesIO object, making it available for in-memory processing.
+        in a BytesIO object, making it available for in-memory processing. The
+        response body is read in chunks rather than buffered as a whole.
 
         Args:
             site_id (str): The ID of the SharePoint site.
             drive_id (str): The ID of the drive within the site.
             file_id (str): The ID of the file to retrieve.
+            stream (bool, optional): If True, the content is written to a SpooledTemporaryFile
+                                     that stays in memory for small files and spills to disk
+                                     for large ones. Defaults to False.
 
         Returns:
-            Optional[BytesIO]: A BytesIO object containing the file content if successful, otherwise None.
+            Optional[Union[BytesIO, SpooledTemporaryFile]]: A file-like object positioned at the
+            beginning of the content if successful, otherwise None.
         """
         self._ensure_access_token_valid()
         file_url: str = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drives/{drive_id}/items/{file_id}/content"
-        headers: Dict[str, str] = {'Authorization': f'Bearer {self.access_token}'}
-
-        response: requests.Response = requests.get(file_url, headers=headers)
-        
-        if response.status_code == 200:
-            return BytesIO(response.content)
-        else:
-            self.system_logger.error(f"Error retrieving file: {response.status_code} - {response.text}")
-            return None
+        headers: Dict[str, str] = self._auth_header
+
+        with self._session.get(file_url, headers=headers, stream=True) as response:
+            if response.status_code == 200:
+                buffer: Union[BytesIO, SpooledTemporaryFile] = SpooledTemporaryFile(max_size=SPOOLED_MAX_SIZE) if stream else BytesIO()
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    buffer.write(chunk)
+                buffer.seek(0)
+                return buffer
+            else:
+                self.system_logger.error(f"Error retrieving file: {response.status_code} - {response.text}")
+                return None
         
+    def _download_target(self, download_url: str) -> Tuple[requests.Session, Dict[str, str]]:
+        """
+        Chooses the session and headers used to fetch a download URL.
+
+        `@microsoft.graph.downloadUrl` values are pre-authenticated links served by SharePoint
+        hosts, so they are fetched without the bearer token through the download session.
+        Only URLs pointing to the Graph API itself get the Authorization header.
+
+        Args:
+            download_url (str): The download URL for the file.
+
+        Returns:
+            Tuple[requests.Session, Dict[str, str]]: The session to use and the headers to send.
+        """
+        if urlparse(download_url).hostname == GRAPH_HOST:
+            self._ensure_access_token_valid()
+            return self._session, self._auth_header
+        return self._download_session, {}
+
     def download_file_to_memory(self, download_url: str) -> Optional[BytesIO]:
         """
         Downloads a file from SharePoint to memory using its download URL.
 
         This method is useful for downloading large files directly into memory without
-        the need for a temporary disk location.
+        the need for a temporary disk location. The response body is read in chunks
+        to avoid holding a second full copy of the content.
 
         Args:
             download_url (str): The download URL for the file.
@@ -403,48 +852,150 @@ class SharePointClient:
         Returns:
             Optional[BytesIO]: A BytesIO object with the file content if successful, otherwise None.
         """
-        self._ensure_access_token_valid()
-        headers: Dict[str, str] = {'Authorization': f'Bearer {self.access_token}'}
-        response: requests.Response = requests.get(download_url, headers=headers)
-        
-        if response.status_code == 200:
-            return BytesIO(response.content)
-        else:
-            self.system_logger.error(f"Failed to retrieve file from URL: {download_url} - {response.status_code} - {response.reason}")
-            return None
+        session, headers = self._download_target(download_url)
+
+        with session.get(download_url, headers=headers, stream=True) as response:
+            if response.status_code == 200:
+                buffer: BytesIO = BytesIO()
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    buffer.write(chunk)
+                buffer.seek(0)
+                return buffer
+            else:
+                self.system_logger.error(f"Failed to retrieve file from URL: {download_url} - {response.status_code} - {response.reason}")
+                return None
         
     def download_file_to_disk(self, download_url: str, local_path: str, file_name: str) -> None:
         """
         Downloads a file from SharePoint to a local directory using its download URL.
 
-        This method creates the necessary local directory structure and saves the file content
-        to the specified path.
+        This method creates the necessary local directory structure and streams the file
+        content to the specified path, keeping memory usage constant regardless of file size.
 
         Args:
             download_url (str): The download URL for the file.
             local_path (str): The local directory path where the file will be saved.
             file_name (str): The name to save the file as.
         """
-        self._ensure_access_token_valid()
-        headers: Dict[str, str]  = {'Authorization': f'Bearer {self.access_token}'}
-        response: requests.Response = requests.get(download_url, headers=headers)
-        if response.status_code == 200:
+        session, headers = self._download_target(download_url)
+        with session.get(download_url, headers=headers, stream=True) as response:
+            if response.status_code == 200:
+                self._write_response_to_disk(response, local_path, file_name)
+            else:
+                self.system_logger.error(f"Failed to download {file_name}: {response.status_code} - {response.reason}")
+
+    def _ensure_dir(self, path: str) -> None:
+        """
+        Creates a local directory once per download run, skipping the filesystem
+        calls for directories already created. The cache is only a hint: writers
+        recreate a directory that disappeared after it was cached.
+
+        Args:
+            path (str): The local directory path.
+        """
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+
+    def _write_response_to_disk(self, response: requests.Response, local_path: str, file_name: str) -> None:
+        """
+        Copies the body of a streamed response to a local file.
+
+        Args:
+            response (requests.Response): A response opened with `stream=True`.
+            local_path (str): The local directory path where the file will be saved.
+            file_name (str): The name to save the file as.
+        """
+        self._ensure_dir(local_path)
+        full_path: str = os.path.join(local_path, file_name)
+        full_path = os.path.normpath(full_path)
+        # Let urllib3 undo any Content-Encoding while copying the raw stream
+        response.raw.decode_content = True
+        try:
+            file = open(full_path, 'wb')
+        except FileNotFoundError:
+            # The cached directory was removed since it was created; create it again
+            self._created_dirs.discard(local_path)
             os.makedirs(local_path, exist_ok=True)
-            full_path: str = os.path.join(local_path, file_name)
-            full_path = os.path.normpath(full_path)
-            with open(full_path, 'wb') as file:
-                file.write(response.content)
-            self.system_logger.debug(f"Downloaded: {full_path}")
-        else:
-            self.system_logger.error(f"Failed to download {file_name}: {response.status_code} - {response.reason}")
+            file = open(full_path, 'wb')
+        with file:
+            shutil.copyfileobj(response.raw, file, length=DOWNLOAD_CHUNK_SIZE)
+        self.system_logger.debug(f"Downloaded: {full_path}")
+
+    def _produce_download(self, download_queue: queue.Queue, cancel: threading.Event, item: Dict[str, Any], local_target_dir: str) -> None:
+        """
+        Opens the download stream of a file and hands it to the writer threads.
+
+        Runs in the network thread pool of `deep_download`. Only the response headers
+        are read here; the body is consumed by `_consume_downloads`. The queue is fed with
+        a timeout so a cancelled run never leaves a producer blocked on a full queue.
+
+        Args:
+            download_queue (queue.Queue): Bounded queue shared with the writer threads.
+            cancel (threading.Event): Set when the run is aborted; pending downloads are dropped.
+            item (Dict[str, Any]): The file item to download.
+            local_target_dir (str): The local directory where the file will be saved.
+        """
+        if cancel.is_set():
+            return
 
-    def deep_download(self, site_id: str, drive_id: str, folder_id: str, local_base_path: str, allowed_extensions: Optional[List[str]] = None, blacklist_paths: Optional[List[str]] = None, keywords_to_skip: Optional[List[str]] = None) -> None:
+        try:
+            session, headers = self._download_target(item['downloadUrl'])
+            response: requests.Response = session.get(item['downloadUrl'], headers=headers, stream=True)
+        except requests.exceptions.RequestException as e:
+            self.system_logger.error(f"Error downloading file '{item['name']}' from '{item['fullPath']}': {e}")
+            return
+
+        if response.status_code != 200:
+            self.system_logger.error(f"Failed to download {item['name']}: {response.status_code} - {response.reason}")
+            response.close()
+            return
+
+        while not cancel.is_set():
+            try:
+                download_queue.put((response, local_target_dir, item), timeout=DOWNLOAD_QUEUE_PUT_TIMEOUT)
+                return
+            except queue.Full:
+                continue
+        response.close()
+
+    def _consume_downloads(self, download_queue: queue.Queue) -> None:
+        """
+        Writes the streams queued by `_produce_download` to disk until a None sentinel is received.
+
+        Failures are logged per file, so a writer thread never dies while producers
+        still depend on it to drain the queue.
+
+        Args:
+            download_queue (queue.Queue): Bounded queue shared with the network threads.
+        """
+        while True:
+            entry: Optional[Tuple[requests.Response, str, Dict[str, Any]]] = download_queue.get()
+            if entry is None:
+                return
+
+            response, local_target_dir, item = entry
+            try:
+                self._write_response_to_disk(response, local_target_dir, item['name'])
+            except requests.exceptions.RequestException as e:
+                self.system_logger.error(f"Error downloading file '{item['name']}' from '{item['fullPath']}': {e}")
+            except OSError as e:
+                self.system_logger.error(f"OS error when creating directory or writing file for '{item['name']}': {e}")
+            except Exception as e:
+                self.system_logger.error(f"Unexpected error writing file '{item['name']}' from '{item['fullPath']}': {e}")
+            finally:
+                response.close()
+
+    def deep_download(self, site_id: str, drive_id: str, folder_id: str, local_base_path: str, allowed_extensions: Optional[List[str]] = None, blacklist_paths: Optional[List[str]] = None, keywords_to_skip: Optional[List[str]] = None, download_workers: int = 8, writer_workers: int = 2) -> None:
         """
         Recursively downloads files from a SharePoint folder, filtering by extension
         and skipping folders based on full path or name keywords.
 
         This method traverses the folder hierarchy, downloading files that match the
         specified criteria and creating a mirrored folder structure on the local disk.
+        Network requests and disk writes are overlapped: a pool of network threads opens
+        the download streams and feeds a bounded queue drained by the writer threads.
+        Errors raised by the network threads are re-raised once every writer has finished.
 
         Args:
             site_id (str): The ID of the SharePoint site.
@@ -460,6 +1011,8 @@ class SharePointClient:
             keywords_to_skip (List[str], optional): A list of keywords (case-insensitive)
                                                     to skip in folder or file names.
                                                     Defaults to None.
+            download_workers (int, optional): Number of threads opening download streams. Defaults to 8.
+            writer_workers (int, optional): Number of threads writing files to disk. Defaults to 2.
         """
         self.system_logger.debug(f"Starting recursive download from folder ID: {folder_id} to {local_base_path}")
 
@@ -470,38 +1023,198 @@ class SharePointClient:
         else:
             self.system_logger.debug("No extensions specified, all files will be downloaded.")
 
-        folder_items: List[Dict[str, Any]] = self.deep_folder_contents(site_id, drive_id, folder_id, blacklist_paths=blacklist_paths, keywords_to_skip=keywords_to_skip)
+        # Consumed lazily: downloads are submitted while the tree is still being listed
+        folder_items: Iterator[Dict[str, Any]] = self.iter_deep_folder_contents(site_id, drive_id, folder_id, blacklist_paths=blacklist_paths, keywords_to_skip=keywords_to_skip)
+
+        self._created_dirs.clear()
+        download_queue: queue.Queue = queue.Queue(maxsize=DOWNLOAD_QUEUE_SIZE)
+        writers: List[threading.Thread] = [
+            threading.Thread(target=self._consume_downloads, args=(download_queue,), daemon=True)
+            for _ in range(writer_workers)
+        ]
+        for writer in writers:
+            writer.start()
+
+        cancel: threading.Event = threading.Event()
+        futures: List[Future] = []
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=download_workers)
+        try:
+            for item in folder_items:
+                full_path: str = os.path.normpath(item['fullPath'])
+                local_target_dir: str = os.path.join(local_base_path, os.path.dirname(full_path))
+
+                if item['type'] == 'Folder':
+                    self._ensure_dir(os.path.join(local_base_path, full_path))
+                    self.system_logger.debug(f"Created local folder: {os.path.join(local_base_path, full_path)}")
+                elif item['type'] == 'File' and item.get('downloadUrl'):
+                    if allowed_extensions_lower:
+                        if item['extension'] and item['extension'].lower() not in allowed_extensions_lower:
+                            self.system_logger.debug(f"Skipping file (extension not allowed): {full_path}")
+                            continue
+
+                    futures.append(executor.submit(self._produce_download, download_queue, cancel, item, local_target_dir))
+                else:
+                    self.system_logger.debug(f"Skipping item (not a downloadable file or folder): {full_path}")
+        except BaseException:
+            # Let queued producers return instead of feeding the writers
+            cancel.set()
+            raise
+        finally:
+            executor.shutdown(wait=True)
+            for _ in writers:
+                download_queue.put(None)
+            for writer in writers:
+                writer.join()
+
+        for future in futures:
+            future.result()
+
+    async def _aget_graph(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str) -> Tuple[int, Any]:
+        """
+        Performs a GET request against Graph for the async API.
+
+        Every request of a run holds one slot of the run's semaphore while it is in flight,
+        so the total number of concurrent Graph requests stays bounded however wide the
+        folder tree is. Throttled (429) and transient (5xx) responses are retried after
+        the `Retry-After` delay, or an exponential backoff when the header is missing;
+        the slot is released while waiting.
+
+        Args:
+            session (aiohttp.ClientSession): The session used to perform the request.
+            semaphore (asyncio.Semaphore): Semaphore limiting the in-flight requests of the run.
+            url (str): The absolute Graph API URL.
+
+        Returns:
+            Tuple[int, Any]: The final status code and the decoded JSON body on success,
+            or the response text otherwise.
+        """
+        for attempt in range(AIO_MAX_RETRIES + 1):
+            await self._aensure_access_token_valid()
+            async with semaphore:
+                async with session.get(url, headers=self._auth_header) as response:
+                    if response.status == 200:
+                        return response.status, orjson.loads(await response.read())
+                    if response.status not in AIO_RETRY_STATUSES or attempt == AIO_MAX_RETRIES:
+                        return response.status, await response.text()
+                    retry_after: float = float(response.headers.get('Retry-After', 2 ** attempt))
+
+            self.system_logger.warning(f"Graph request throttled ({response.status}). Retrying in {retry_after}s: {url}")
+            await asyncio.sleep(retry_after)
+
+    async def aget_folder_content(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, site_id: str, drive_id: str, folder_id: str = "root", path: str = "") -> List[Dict[str, Any]]:
+        """
+        Asynchronous counterpart of `get_folder_content`, sharing a single aiohttp session.
+
+        Args:
+            session (aiohttp.ClientSession): The session used to perform the requests.
+            semaphore (asyncio.Semaphore): Semaphore limiting the in-flight requests of the run.
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            folder_id (str, optional): The ID of the folder to list contents from. Defaults to "root".
+            path (str, optional): The current path for building the fullPath. Used internally.
+
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries, where each dictionary represents a file or folder.
+
+        Raises:
+            Exception: If Graph keeps throttling or failing the listing after all retries, so
+                       the folder is never silently missing from the results.
+        """
+        folder_contents_url: str = self._folder_content_url(site_id, drive_id, folder_id)
+
+        items_list: List[Dict[str, Any]] = []
+        path_prefix: str = self._path_prefix(path)
+
+        while folder_contents_url:
+            status, folder_contents = await self._aget_graph(session, semaphore, folder_contents_url)
+            if status in AIO_RETRY_STATUSES:
+                raise Exception(f"Error fetching folder contents for '{path}' after {AIO_MAX_RETRIES} retries: {status}")
+            if status != 200:
+                self.system_logger.error(f"Error fetching folder contents: {status} - {folder_contents}")
+                return []
+
+            items_list.extend(self._build_item_info(item, path, path_prefix) for item in folder_contents.get('value', []))
+
+            folder_contents_url = folder_contents.get('@odata.nextLink', None)
+
+        return items_list
+
+    async def adeep_folder_contents(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, site_id: str, drive_id: str, folder_id: str = "root", current_path: str = "", blacklist_paths: List[str] = None, keywords_to_skip: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Asynchronous counterpart of `deep_folder_contents`.
+
+        Subfolders found at each level are listed concurrently with `asyncio.gather`;
+        the semaphore bounds the requests actually in flight.
 
-        for item in folder_items:
-            full_path: str = os.path.normpath(item['fullPath'])
-            local_target_dir: str = os.path.join(local_base_path, os.path.dirname(full_path))
+        Args:
+            session (aiohttp.ClientSession): The session used to perform the requests.
+            semaphore (asyncio.Semaphore): Semaphore limiting the in-flight requests of the run.
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            folder_id (str, optional): The ID of the folder to start the search from. Defaults to "root".
+            current_path (str, optional): The current path for building fullPath. Used internally for recursion.
+            blacklist_paths (List[str], optional): A list of full paths (case-insensitive) to folders that should be skipped.
+            keywords_to_skip (List[str], optional): A list of keywords (case-insensitive) to skip in folder or file names.
+
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries representing files and folders.
+        """
+        blacklist_re: Optional[re.Pattern] = self._compile_filter(self._normalize_path(p) for p in blacklist_paths or [])
+        keywords_re: Optional[re.Pattern] = self._compile_filter(keyword.lower() for keyword in keywords_to_skip or [])
+
+        return await self._adeep_folder_contents(session, semaphore, site_id, drive_id, folder_id, current_path, blacklist_re, keywords_re)
+
+    async def _adeep_folder_contents(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, site_id: str, drive_id: str, folder_id: str, current_path: str, blacklist_re: Optional[re.Pattern], keywords_re: Optional[re.Pattern]) -> List[Dict[str, Any]]:
+        """
+        Recursive worker for `adeep_folder_contents` receiving the precompiled filters.
+
+        Args:
+            session (aiohttp.ClientSession): The session used to perform the requests.
+            semaphore (asyncio.Semaphore): Semaphore limiting the in-flight requests of the run.
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            folder_id (str): The ID of the folder to list.
+            current_path (str): The path of the folder being listed.
+            blacklist_re (Optional[re.Pattern]): Compiled blacklist paths.
+            keywords_re (Optional[re.Pattern]): Compiled keywords to skip.
+
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries representing files and folders.
+        """
+        if blacklist_re and blacklist_re.match(self._normalize_path(current_path)):
+            self.system_logger.debug(f"Skipping blacklisted folder path: {current_path}")
+            return []
+
+        current_folder_items: List[Dict[str, Any]] = await self.aget_folder_content(session, semaphore, site_id, drive_id, folder_id, current_path)
+
+        all_items: List[Dict[str, Any]] = []
+        subfolders: List[Dict[str, Any]] = []
+
+        for item in current_folder_items:
+            if self._skip_item(item, blacklist_re, keywords_re):
+                continue
+
+            all_items.append(item)
 
             if item['type'] == 'Folder':
-                os.makedirs(os.path.join(local_base_path, full_path), exist_ok=True)
-                self.system_logger.debug(f"Created local folder: {os.path.join(local_base_path, full_path)}")
-            elif item['type'] == 'File' and item.get('downloadUrl'):
-                if allowed_extensions_lower:
-                    if item['extension'] and item['extension'].lower() not in allowed_extensions_lower:
-                        self.system_logger.debug(f"Skipping file (extension not allowed): {full_path}")
-                        continue
-                
-                os.makedirs(local_target_dir, exist_ok=True)
-                
-                try:
-                    self.download_file_to_disk(item['downloadUrl'], local_target_dir, item['name'])
-                except requests.exceptions.RequestException as e:
-                    self.system_logger.error(f"Error downloading file '{item['name']}' from '{full_path}': {e}")
-                except OSError as e:
-                    self.system_logger.error(f"OS error when creating directory or writing file for '{item['name']}': {e}")               
-            else:
-                self.system_logger.debug(f"Skipping item (not a downloadable file or folder): {full_path}")
+                subfolders.append(item)
+
+        subfolder_results: List[List[Dict[str, Any]]] = await asyncio.gather(*[
+            self._adeep_folder_contents(session, semaphore, site_id, drive_id, item['id'], item['fullPath'], blacklist_re, keywords_re)
+            for item in subfolders
+        ])
+        for subfolder_items in subfolder_results:
+            all_items.extend(subfolder_items)
+
+        return all_items
 
     def upload_file(self, site_id: str, drive_id: str, folder_id: str, file_name: str, file_content: Union[bytes, BytesIO]) -> Optional[Dict[str, Any]]:
         """
         Uploads a file to a specific folder in SharePoint.
 
         This method handles the upload of file content, which can be provided as bytes or
-        a BytesIO object, to a designated location within a SharePoint drive.
+        a BytesIO object, to a designated location within a SharePoint drive. Files larger
+        than 4 MiB are sent in chunks through a Graph upload session.
 
         Args:
             site_id (str): The ID of the SharePoint site.
@@ -516,23 +1229,26 @@ class SharePointClient:
         self._ensure_access_token_valid()
         upload_url: str = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drives/{drive_id}/items/{folder_id}:/{file_name}:/content"
         headers: Dict[str, str] = {
-            'Authorization': f'Bearer {self.access_token}',
+            **self._auth_header,
             'Content-Type': 'application/octet-stream' # Or appropriate MIME type if known
         }
         try:
-            if isinstance(file_content, BytesIO):
-                file_content.seek(0) # Ensure content is read from the beginning
-                data_to_upload = file_content.read()
-            elif isinstance(file_content, bytes):
-                data_to_upload = file_content
-            else:
+            if isinstance(file_content, bytes):
+                file_content = BytesIO(file_content)
+            elif not isinstance(file_content, BytesIO):
                 self.system_logger.error("file_content must be bytes or a BytesIO object")
                 raise ValueError("file_content must be bytes or a BytesIO object")
 
-            response: requests.Response = requests.put(upload_url, headers=headers, data=data_to_upload)
+            total_size: int = file_content.getbuffer().nbytes
+            file_content.seek(0) # Ensure content is read from the beginning
+
+            if total_size > SIMPLE_UPLOAD_MAX_SIZE:
+                return self._upload_large_file(site_id, drive_id, folder_id, file_name, file_content, total_size)
+
+            response: requests.Response = self._session.put(upload_url, headers=headers, data=file_content.read())
             response.raise_for_status() # Raise an HTTPError for bad responses (4xx or 5xx)
             self.system_logger.debug(f"File '{file_name}' uploaded successfully.")
-            return response.json()
+            return self._json(response)
         except requests.exceptions.HTTPError as e:
             self.system_logger.error(f"Error uploading file: {e}")
             self.system_logger.error(f"Response: {e.response.text}")
@@ -540,6 +1256,55 @@ class SharePointClient:
         except ValueError as e:
             self.system_logger.error(f"Invalid file_content type: {e}")
             return None
+
+    def _upload_large_file(self, site_id: str, drive_id: str, folder_id: str, file_name: str, file_content: BytesIO, total_size: int) -> Optional[Dict[str, Any]]:
+        """
+        Uploads a file in chunks through a Graph upload session.
+
+        Chunks are read lazily from `file_content`, so only one chunk is held in memory
+        at a time. A chunk rejected with 429 or 5xx is re-sent by the session's retry
+        policy (honoring `Retry-After`), without restarting the whole upload.
+
+        Args:
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            folder_id (str): The ID of the destination folder.
+            file_name (str): The name of the file to be uploaded.
+            file_content (BytesIO): The content of the file, positioned at the beginning.
+            total_size (int): The total size of the content in bytes.
+
+        Returns:
+            Optional[Dict[str, Any]]: The metadata of the uploaded file if successful, otherwise None.
+
+        Raises:
+            requests.exceptions.HTTPError: If the session cannot be created or a chunk keeps failing.
+        """
+        session_url: str = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drives/{drive_id}/items/{folder_id}:/{file_name}:/createUploadSession"
+        headers: Dict[str, str] = self._auth_header
+        body: Dict[str, Any] = {"item": {"@microsoft.graph.conflictBehavior": "replace"}}
+
+        session_response: requests.Response = self._session.post(session_url, headers=headers, json=body)
+        session_response.raise_for_status()
+        upload_url: str = self._json(session_response)['uploadUrl']
+
+        start: int = 0
+        response: Optional[requests.Response] = None
+        while start < total_size:
+            chunk: bytes = file_content.read(UPLOAD_CHUNK_SIZE)
+            end: int = start + len(chunk) - 1
+            # The upload URL is pre-authenticated, so no Authorization header is sent
+            chunk_headers: Dict[str, str] = {
+                'Content-Length': str(len(chunk)),
+                'Content-Range': f'bytes {start}-{end}/{total_size}'
+            }
+
+            # Throttled or failed chunks are re-sent by the session's retry policy
+            response = self._session.put(upload_url, headers=chunk_headers, data=chunk)
+            response.raise_for_status()
+            start = end + 1
+
+        self.system_logger.debug(f"File '{file_name}' uploaded successfully in chunks.")
+        return self._json(response) if response is not None else None
         
     def delete_file(self, site_id: str, drive_id: str, file_id: str) -> bool:
         """
@@ -555,8 +1320,8 @@ class SharePointClient:
         """
         self._ensure_access_token_valid()
         delete_url: str = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drives/{drive_id}/items/{file_id}"
-        headers: Dict[str, str] = {'Authorization': f'Bearer {self.access_token}'}
-        response: requests.Response = requests.delete(delete_url, headers=headers)
+        headers: Dict[str, str] = self._auth_header
+        response: requests.Response = self._session.delete(delete_url, headers=headers)
         if response.status_code == 204: # 204 No Content for successful deletion
             self.system_logger.debug(f"File with ID '{file_id}' deleted successfully.")
             return True
@@ -583,21 +1348,40 @@ class SharePointClient:
         self._ensure_access_token_valid()
         create_folder_url: str = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drives/{drive_id}/items/{parent_folder_id}/children"
         headers: Dict[str, str] = {
-            'Authorization': f'Bearer {self.access_token}',
+            **self._auth_header,
             'Content-Type': 'application/json'
         }
         body: Dict[str, Any] = {
             "name": folder_name,
             "folder": {}
         }
-        response: requests.Response = requests.post(create_folder_url, headers=headers, json=body)
+        response: requests.Response = self._session.post(create_folder_url, headers=headers, json=body)
         if response.status_code == 201: # 201 Created for successful creation
             self.system_logger.debug(f"Folder '{folder_name}' created successfully.")
-            return response.json()
+            return self._json(response)
         else:
             self.system_logger.error(f"Error creating folder: {response.status_code} - {response.text}")
             return None
         
+    @staticmethod
+    def _search_url(site_id: str, drive_id: str, search_query: str) -> str:
+        """
+        Builds the drive search URL for a query.
+
+        Single quotes are doubled, as OData string literals require, and the query is
+        percent-encoded so spaces, '&' or '#' do not break the request.
+
+        Args:
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            search_query (str): The query string to search for.
+
+        Returns:
+            str: The URL of the Graph search endpoint.
+        """
+        encoded_query: str = quote(search_query.replace("'", "''"), safe='')
+        return f"{GRAPH_BASE_URL}/sites/{site_id}/drives/{drive_id}/root/search(q='{encoded_query}')"
+
     def search_items(self, site_id: str, drive_id: str, search_query: str) -> List[Dict[str, Any]]:
         """
         Searches for items (files/folders) within a drive by name.
@@ -614,11 +1398,11 @@ class SharePointClient:
             List[Dict[str, Any]]: A list of dictionaries representing the found items.
         """
         self._ensure_access_token_valid()
-        search_url: str = f"https://graph.microsoft.com/v1.0/sites/{site_id}/drives/{drive_id}/root/search(q='{search_query}')"
-        headers: Dict[str, str] = {'Authorization': f'Bearer {self.access_token}'}
-        response: requests.Response = requests.get(search_url, headers=headers)
+        search_url: str = self._search_url(site_id, drive_id, search_query)
+        headers: Dict[str, str] = self._auth_header
+        response: requests.Response = self._session.get(search_url, headers=headers, params={'$select': SEARCH_SELECT})
         if response.status_code == 200:
-            return response.json().get('value', [])
+            return self._json(response).get('value', [])
         else:
             self.system_logger.error(f"Error searching items: {response.status_code} - {response.text}")
             return []
@@ -629,7 +1413,9 @@ class SharePointClient:
 
         This method allows for a comprehensive search across a drive, with the option
         to restrict the search to specific whitelisted paths or exclude certain
-        blacklisted paths and keywords.
+        blacklisted paths and keywords. The search runs `adeep_search` on its own event
+        loop, so it must be called from a thread without a running loop (the synchronizers
+        run in a worker thread).
 
         Args:
             site_id (str): The ID of the SharePoint site.
@@ -642,24 +1428,53 @@ class SharePointClient:
         Returns:
             list: A list of dictionaries representing files and folders.
         """
-        if keywords_to_skip is None:
-            keywords_to_skip = []
+        return asyncio.run(self.adeep_search(site_id, drive_id, folder_id, whitelist_paths, blacklist_paths, keywords_to_skip))
+
+    async def adeep_search(self, site_id: str, drive_id: str, folder_id: str = "root", whitelist_paths: List[str] = None, blacklist_paths: List[str] = None, keywords_to_skip: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Asynchronous counterpart of `deep_search`.
+
+        Whitelisted paths are resolved together through `get_item_ids`, 20 per `$batch`
+        round trip, and then walked concurrently, so the total time is bounded by the
+        slowest path instead of the sum of all of them. Each run opens its own aiohttp
+        session and shares one semaphore across every Graph request it makes, keeping at most
+        `AIO_SEARCH_CONCURRENCY` requests in flight.
+
+        Args:
+            site_id (str): The ID of the SharePoint site.
+            drive_id (str): The ID of the drive within the site.
+            folder_id (str, optional): The ID of the folder to start the search from. Defaults to "root".
+            whitelist_paths (List[str], optional): A list of full paths to include. Defaults to None.
+            blacklist_paths (List[str], optional): A list of full paths to exclude. Defaults to None.
+            keywords_to_skip (List[str], optional): A list of keywords to skip in folder or file names. Defaults to None.
+
+        Returns:
+            list: A list of dictionaries representing files and folders.
+        """
+        connector: aiohttp.TCPConnector = aiohttp.TCPConnector(limit=AIO_CONNECTION_LIMIT, keepalive_timeout=AIO_KEEPALIVE_TIMEOUT)
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(AIO_SEARCH_CONCURRENCY)
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            if not whitelist_paths:
+                if blacklist_paths:
+                    self.system_logger.debug(f"Using blacklist for search: {blacklist_paths}")
+                else:
+                    self.system_logger.debug("No whitelist or blacklist provided, performing a full deep search.")
+                return await self.adeep_folder_contents(session, semaphore, site_id, drive_id, folder_id, blacklist_paths=blacklist_paths, keywords_to_skip=keywords_to_skip)
 
-        all_items = []
-        if whitelist_paths:
             self.system_logger.debug(f"Using whitelist for search: {whitelist_paths}")
-            for path in whitelist_paths:
-                item_id = self.get_item_id(site_id, drive_id, path)
-                if item_id:
-                    items = self.deep_folder_contents(site_id, drive_id, item_id, path,keywords_to_skip=keywords_to_skip)
-                    all_items.extend(items)
 
-        else:
-            if blacklist_paths:
-                self.system_logger.debug(f"Using blacklist for search: {blacklist_paths}")
-                all_items = self.deep_folder_contents(site_id, drive_id, folder_id, blacklist_paths=blacklist_paths, keywords_to_skip=keywords_to_skip)
-            else:
-                self.system_logger.debug("No whitelist or blacklist provided, performing a full deep search.")
-                all_items = self.deep_folder_contents(site_id, drive_id, folder_id, keywords_to_skip=keywords_to_skip)            
-            
-        return all_items
\ No newline at end of file
+            item_ids: Dict[str, Optional[str]] = await asyncio.to_thread(self.get_item_ids, site_id, drive_id, whitelist_paths)
+
+            async def search_path(path: str) -> List[Dict[str, Any]]:
+                item_id: Optional[str] = item_ids.get(path)
+                if not item_id:
+                    return []
+                return await self.adeep_folder_contents(session, semaphore, site_id, drive_id, item_id, path, keywords_to_skip=keywords_to_skip)
+
+            results: List[List[Dict[str, Any]]] = await asyncio.gather(*[search_path(path) for path in whitelist_paths])
+
+        all_items: List[Dict[str, Any]] = []
+        for items in results:
+            all_items.extend(items)
+        return all_items
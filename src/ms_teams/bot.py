@@ -1,10 +1,15 @@
 
-import traceback
+import copy
 import time
+import hashlib
+import asyncio
+from functools import lru_cache
 from logging import Logger
-from typing import  Any, Optional, Dict, List
+from typing import  Any, Optional, Dict, List, Tuple, FrozenSet, Callable
 from pathlib import Path
 
+from cachetools import LRUCache
+
 from botbuilder.core import (
     TurnContext, 
     ActivityHandler, 
@@ -21,6 +26,7 @@ from src.auth.manager import AuthManager, Permission
 from src.lang_chain.memory_manager import MemoryManager
 from src.stats.stats_manager import StatsManager
 from src.ms_teams.handler_registry.registry import HandlerRegistry
+from src.ms_teams.handler_registry.router import HandlerRouter
 from src.ms_teams.handlers.base_handler import BaseHandler
 from src.ms_teams.handlers.admin_handler import AdminHandler
 from src.ms_teams.handlers.echo_handler import EchoHandler
@@ -35,6 +41,53 @@ from src.log.system_logger import Logger, get_system_logger
 from src.log.user_logger import get_user_logger
 from src.utils.yaml import load_yaml
 from src.utils.txt import load_txt
+from src.utils.json import load_json, save_json
+
+_VECTOR_STORES: Dict[Tuple[str, str], Any] = {}
+
+def _get_vector_store(openai_vector_store_id: str, openai_api_key: str) -> Optional[Any]:
+    """
+    Memoized `check_vector_store_by_id`. Only stores that were found are cached, so a
+    missing store or a transient OpenAI failure is checked again on the next call.
+    """
+    cache_key: Tuple[str, str] = (openai_vector_store_id, openai_api_key)
+    vector_store: Optional[Any] = _VECTOR_STORES.get(cache_key)
+    if vector_store is None:
+        vector_store = check_vector_store_by_id(openai_vector_store_id, openai_api_key)
+        if vector_store is not None:
+            _VECTOR_STORES[cache_key] = vector_store
+    return vector_store
+
+@lru_cache(maxsize=None)
+def _load_handler_map(handler_cfg_path: str) -> Dict[str, Dict]:
+    """
+    Reads the handler configuration once per process. Callers must copy it before mutating.
+    """
+    return load_yaml(handler_cfg_path)
+
+@lru_cache(maxsize=None)
+def _load_welcome_template(template_path: str) -> str:
+    """
+    Reads the welcome message template once per process.
+    """
+    return load_txt(template_path)
+
+USER_LOGGER_CACHE_SIZE: int = 512
+DEFAULT_HANDLER: str = "sgc"
+CLEAR_COMMAND: str = "/clear"
+
+class UserLoggerCache(LRUCache):
+    """
+    LRU cache of user loggers that closes a logger's file handlers when it is evicted.
+
+    The handlers stay attached to the logger. They are opened in append mode,
+    so a turn still holding an evicted logger reopens the file on its next write.
+    """
+    def popitem(self) -> Tuple[str, Logger]:
+        user_id, user_logger = super().popitem()
+        for handler in user_logger.handlers:
+            handler.close()
+        return user_id, user_logger
 
 class MSTeamsBot(ActivityHandler):
     """
@@ -55,7 +108,7 @@ class MSTeamsBot(ActivityHandler):
         settings (Settings): Application settings.
         system_logger (Logger): Logger for system-wide events.
         stats_manager (StatsManager): Manages the logging of usage statistics.
-        user_loggers (dict): A dictionary to store loggers for individual users.
+        user_loggers (UserLoggerCache): Loggers for the most recently active users; evicted loggers release their files.
         auth_manager (AuthManager): Manages user authentication.
         auth_middleware (AuthMiddleware): Middleware for authentication checks.
         adapter (BotFrameworkAdapter): Adapter for processing bot activities.
@@ -79,11 +132,16 @@ class MSTeamsBot(ActivityHandler):
         """
         super().__init__()
         self.settings: Settings = get_settings()
-        self._hanlder_map: Dict[str, Dict] = load_yaml(str(Path(self.settings.handler_cfg_path)))
-        self._welcome_template: str = load_txt(str(Path(self.settings.templates_dir) / "welcome/template.txt"))
+        # Handler instances are stored in the map, so each bot works on its own copy
+        templates_root: Path = Path(self.settings.templates_dir)
+        self._rag_templates_dir: str = str(templates_root / "rag")
+        self._llm_templates_dir: str = str(templates_root / "llm")
+        self._welcome_template_path: str = str(templates_root / "welcome" / "template.txt")
+        self._hanlder_map: Dict[str, Dict] = copy.deepcopy(_load_handler_map(str(Path(self.settings.handler_cfg_path))))
+        self._welcome_template: str = _load_welcome_template(self._welcome_template_path)
         self.system_logger: Logger = get_system_logger(__name__)
         self.stats_manager: StatsManager = StatsManager(self.settings.stats_file_path)
-        self.user_loggers: Dict[str, Logger] = {}
+        self.user_loggers: UserLoggerCache = UserLoggerCache(maxsize=USER_LOGGER_CACHE_SIZE)
 
         # Initialize authentication components
         self.auth_manager: AuthManager = auth_manager or AuthManager()
@@ -130,9 +188,7 @@ class MSTeamsBot(ActivityHandler):
         
         # Error handler
         async def on_error(context: TurnContext, error: Exception):
-            traceback.print_exc()
-
-            self.system_logger.error(f"Bot error: {str(error)}")
+            self.system_logger.error(f"Bot error: {str(error)}", exc_info=error)
             # Message when an error occurs
             await context.send_activity(
                 MessageFactory.text("Lo siento, ocurrió un error procesando tu mensaje.")
@@ -161,109 +217,85 @@ class MSTeamsBot(ActivityHandler):
         """
         Registers default message handlers with the handler registry.
 
-        This method initializes and registers the AdminHandler, LLMHandler,
-        SGCHandler, REFHandler and EchoHandler. It also designates the LLMHandler as
-        the default fallback handler.
-        """
-        # Register RAG Handler (SGC)
-        sgc_handler = RAGHandler(
-            self.auth_manager,
-            self.auth_middleware,
-            self.settings.openai_vector_store_id_sgc,
-            self._hanlder_map["sgc"]["prefix"],
-            Permission(self._hanlder_map["sgc"]["permission"]),
-            self._hanlder_map["sgc"]["name"],
-            self._hanlder_map["sgc"]["description"],
-            self.stats_manager,
-            self.memory_manager,
-            str(Path(self.settings.templates_dir) / "rag"),
-            "_instructions_sgc.txt"
-            )
-        self.handler_registry.register_handler(self._hanlder_map["sgc"]["name"], sgc_handler, is_default=True)
-        self._hanlder_map["sgc"]["instance"] = sgc_handler
-
-        # Register RAG Handler (REF)
-        ref_handler = RAGHandler(
-            self.auth_manager,
-            self.auth_middleware,
-            self.settings.openai_vector_store_id_ref,
-            self._hanlder_map["ref"]["prefix"],
-            Permission(self._hanlder_map["ref"]["permission"]),
-            self._hanlder_map["ref"]["name"],
-            self._hanlder_map["ref"]["description"],
-            self.stats_manager,
-            self.memory_manager,
-            str(Path(self.settings.templates_dir) / "rag"),
-            "_instructions_ref.txt"
-            )
-        self.handler_registry.register_handler(self._hanlder_map["ref"]["name"], ref_handler, is_default=False)
-        self._hanlder_map["ref"]["instance"] = ref_handler
-
-        # Register LLM Handler
-        llm_handler = LLMHandler(
-            self.auth_manager,
-            self.auth_middleware,
-            self._hanlder_map["llm"]["prefix"],
-            Permission(self._hanlder_map["llm"]["permission"]),
-            self._hanlder_map["llm"]["name"],
-            self._hanlder_map["llm"]["description"],
-            self.stats_manager,
-            self.memory_manager,
-            str(Path(self.settings.templates_dir) / "llm")
-            )
-        self.handler_registry.register_handler(self._hanlder_map["llm"]["name"], llm_handler, is_default=False)
-        self._hanlder_map["llm"]["instance"] = llm_handler
-
-        # Register Admin Handler
-        admin_handler = AdminHandler(
-            self.auth_manager,
-            self.auth_middleware,
-            self._hanlder_map["admin"]["prefix"],
-            Permission(self._hanlder_map["admin"]["permission"]),
-            self._hanlder_map["admin"]["name"],
-            self._hanlder_map["admin"]["description"],
-            )
-        self.handler_registry.register_handler(self._hanlder_map["admin"]["name"], admin_handler, is_default=False)
-        self._hanlder_map["admin"]["instance"] = admin_handler
-
-        # Register File Handler
-        file_handler = FileHandler(
-            self.auth_manager,
-            self.auth_middleware,
-            self._hanlder_map["file"]["prefix"],
-            Permission(self._hanlder_map["file"]["permission"]),
-            self._hanlder_map["file"]["name"],
-            self._hanlder_map["file"]["description"],
-            self.stats_manager,
-            )
-        self.handler_registry.register_handler(self._hanlder_map["file"]["name"], file_handler, is_default=False)
-        self._hanlder_map["file"]["instance"] = file_handler
-
-        # Register Echo Handler
-        echo_handler = EchoHandler(
-            self.auth_middleware,
-            self._hanlder_map["echo"]["prefix"],
-            Permission(self._hanlder_map["echo"]["permission"]),
-            self._hanlder_map["echo"]["name"],
-            self._hanlder_map["echo"]["description"],
-            )
-        self.handler_registry.register_handler(self._hanlder_map["echo"]["name"], echo_handler, is_default=False)
-        self._hanlder_map["echo"]["instance"] = echo_handler
-
-        # Register Help Handler
-        help_handler = HelpHandler(
-            self.auth_manager,
-            self.auth_middleware,
-            self._hanlder_map,
-            self._hanlder_map["help"]["prefix"],
-            self._hanlder_map["help"]["name"],
-            self._hanlder_map["help"]["description"],
-        )
-        self._hanlder_map["help"]["instance"] = help_handler
-        self.handler_registry.register_handler(self._hanlder_map["help"]["name"], help_handler, is_default=False)
+        This method initializes and registers the SGC and REF RAGHandlers, LLMHandler,
+        AdminHandler, FileHandler, EchoHandler and HelpHandler from a table of
+        factories, one per entry of the handler configuration. It also designates
+        the SGC handler as the default fallback handler.
+        """
+        handler_factories: Dict[str, Callable[[Dict], BaseHandler]] = {
+            "sgc": lambda info: RAGHandler(
+                self.auth_manager, self.auth_middleware, self.settings.openai_vector_store_id_sgc,
+                *self._handler_args(info), self.stats_manager, self.memory_manager,
+                self._rag_templates_dir, "_instructions_sgc.txt"
+            ),
+            "ref": lambda info: RAGHandler(
+                self.auth_manager, self.auth_middleware, self.settings.openai_vector_store_id_ref,
+                *self._handler_args(info), self.stats_manager, self.memory_manager,
+                self._rag_templates_dir, "_instructions_ref.txt"
+            ),
+            "llm": lambda info: LLMHandler(
+                self.auth_manager, self.auth_middleware,
+                *self._handler_args(info), self.stats_manager, self.memory_manager,
+                self._llm_templates_dir
+            ),
+            "admin": lambda info: AdminHandler(
+                self.auth_manager, self.auth_middleware, *self._handler_args(info)
+            ),
+            "file": lambda info: FileHandler(
+                self.auth_manager, self.auth_middleware, *self._handler_args(info), self.stats_manager
+            ),
+            "echo": lambda info: EchoHandler(
+                self.auth_middleware, *self._handler_args(info)
+            ),
+            "help": lambda info: HelpHandler(
+                self.auth_manager, self.auth_middleware, self._hanlder_map,
+                info["prefix"], info["name"], info["description"]
+            ),
+        }
+
+        for handler_key, factory in handler_factories.items():
+            handler_info: Dict = self._hanlder_map[handler_key]
+            handler: BaseHandler = factory(handler_info)
+            self.handler_registry.register_handler(handler_info["name"], handler, is_default=(handler_key == DEFAULT_HANDLER))
+            handler_info["instance"] = handler
+
+        # Rendered help is rebuilt after any handler change
+        self.handler_registry.add_change_listener(self._hanlder_map["help"]["instance"].invalidate)
+
+        # Build the command prefix routing table
+        self._router: HandlerRouter = HandlerRouter()
+        for handler_info in self._hanlder_map.values():
+            self._router.add_route(handler_info["prefix"], handler_info["instance"])
+
+        # Handlers listed in the welcome message
+        self._welcome_handlers: List[Dict] = [
+            handler_info for handler_info in self._hanlder_map.values()
+            if handler_info.get("name") not in ("help", "echo")
+        ]
+        for handler_info in self._welcome_handlers:
+            handler_info["section"] = self._build_welcome_section(handler_info)
+        self._welcome_cache: Dict[Tuple[str, FrozenSet[str]], str] = {}
 
         self.system_logger.info("Authentication-enabled handlers registered")
         
+    @staticmethod
+    def _handler_args(handler_info: Dict) -> Tuple[str, Permission, str, str]:
+        """
+        Extracts the constructor arguments shared by the permission-based handlers.
+
+        Args:
+            handler_info (Dict): The handler's entry in the handler configuration.
+
+        Returns:
+            Tuple[str, Permission, str, str]: The handler's prefix, required permission, name and description.
+        """
+        return (
+            handler_info["prefix"],
+            Permission(handler_info["permission"]),
+            handler_info["name"],
+            handler_info["description"],
+        )
+
     @staticmethod 
     def _get_user_message(turn_context: TurnContext) -> str:
         """
@@ -313,7 +345,9 @@ class MSTeamsBot(ActivityHandler):
             
             user_logger.info(f"USER: {message}")
 
-            if message.strip().lower() == "/clear":
+            stripped_message: str = message.strip() if message else ""
+            # Length check first: long messages are never lowercased just to be compared
+            if len(stripped_message) == len(CLEAR_COMMAND) and stripped_message.casefold() == CLEAR_COMMAND:
                 start_time = time.time()
                 user_info = self.auth_middleware.get_user_info(turn_context)
                 if user_info:
@@ -376,11 +410,21 @@ class MSTeamsBot(ActivityHandler):
         Handles activities when new members are added to the conversation.
 
         A welcome message is sent to each new member who is not the bot itself.
+        When the bot is the only member added, the activity is ignored before any
+        authentication work. The list of available commands is cached per role and
+        permission set.
 
         Args:
             members_added (list[ChannelAccount]): A list of members who have been added.
             turn_context (TurnContext): The context for the current turn.
         """
+        recipient_id: str = turn_context.activity.recipient.id
+        new_members: List[ChannelAccount] = [member for member in members_added if member.id != recipient_id]
+
+        # Nothing to do when the only member added is the bot itself
+        if not new_members:
+            return
+
         is_authorized, error_msg = await self.auth_middleware.process_message(turn_context)
 
         if not is_authorized:
@@ -392,49 +436,69 @@ class MSTeamsBot(ActivityHandler):
         user_role = user_info["role"] if user_info else "ROLE"
         user_permissions = user_info["permissions"] if user_info else []
 
-        sections: List = []
+        welcome_key: Tuple[str, FrozenSet[str]] = (user_role, frozenset(user_permissions))
+        bot_commands: Optional[str] = self._welcome_cache.get(welcome_key)
+        if bot_commands is None:
+            bot_commands = "\n\n".join(self._build_welcome_sections(user_permissions))
+            self._welcome_cache[welcome_key] = bot_commands
 
-        for _, handler_info in self._hanlder_map.items():
-            handler_permission = handler_info.get("permission")
-            handler_name = handler_info.get("name")
+        welcome_text = self._welcome_template.format(
+            user_name=user_name,
+            user_role=user_role,
+            bot_commands= bot_commands
+        )
 
-            if handler_name in ["help", "echo"]:
-                continue
-            
-            if handler_permission is None or handler_permission in user_permissions:
-                handler_prefix: str = handler_info.get("prefix")
-                handler_instance: BaseHandler = handler_info.get("instance")
-                handler_metadata: Dict = handler_info.get("metadata", {}) 
-            
-                help_data: Dict = handler_instance.get_help() if handler_instance else {}
+        welcome_activity: Activity = MessageFactory.text(welcome_text)
+        await asyncio.gather(*(turn_context.send_activity(welcome_activity) for _ in new_members))
 
-                functionalities_list: List = handler_metadata.get("functionality", help_data.get('functionality', []))
+    @staticmethod
+    def _build_welcome_section(handler_info: Dict) -> str:
+        """
+        Formats the welcome message section describing a handler.
 
-                section = f"**/{handler_prefix}**\n\n"
-                if functionalities_list:
-                    functionalities = "\n".join([f"- {func}" for func in functionalities_list])
-                    section += f"\n{functionalities}\n\n"
+        Args:
+            handler_info (Dict): The handler's configuration, including its registered instance.
 
-                sections.append(section)
+        Returns:
+            str: The handler's command and its list of functionalities.
+        """
+        handler_prefix: str = handler_info.get("prefix")
+        handler_instance: BaseHandler = handler_info.get("instance")
+        handler_metadata: Dict = handler_info.get("metadata", {}) 
+    
+        help_data: Dict = handler_instance.get_help() if handler_instance else {}
 
-        bot_commands: str = "\n\n".join(sections)
+        functionalities_list: List = handler_metadata.get("functionality", help_data.get('functionality', []))
 
-        welcome_text = self._welcome_template.format(
-            user_name=user_name,
-            user_role=user_role,
-            bot_commands= bot_commands
-        )
+        section = f"**/{handler_prefix}**\n\n"
+        if functionalities_list:
+            functionalities = "\n".join([f"- {func}" for func in functionalities_list])
+            section += f"\n{functionalities}\n\n"
+
+        return section
+
+    def _build_welcome_sections(self, user_permissions: List[str]) -> List[str]:
+        """
+        Selects the precomputed welcome message sections of the handlers available to the user.
+
+        Args:
+            user_permissions (List[str]): The permissions granted to the user.
 
-        for member in members_added:
-            if member.id != turn_context.activity.recipient.id:
-                await turn_context.send_activity(welcome_text)
+        Returns:
+            List[str]: One formatted section per handler the user is allowed to use.
+        """
+        return [
+            handler_info["section"] for handler_info in self._welcome_handlers
+            if handler_info.get("permission") is None or handler_info["permission"] in user_permissions
+        ]
 
     def _route_message_to_handler(self, turn_context: TurnContext) -> Optional[Any]:
         """
         Routes an incoming message to the appropriate handler based on its content.
 
-        The method checks the message prefix for specific commands like '/admin',
-        '/echo', '/sgc', '/ref' or '/llm' to select a dedicated handler. If no specific
+        The method looks up the leading command of the message (e.g. '/admin', '/echo',
+        '/sgc', '/ref' or '/llm') in the prefix trie built at registration time to select
+        a dedicated handler, which then confirms it with `can_handle`. If no specific
         command is found, it defaults to the pre-configured default handler.
 
         Args:
@@ -445,54 +509,10 @@ class MSTeamsBot(ActivityHandler):
                          if no handler is available.
         """
         message = self._get_user_message(turn_context)
-        # Check for admin commands first
-        if message.strip().startswith("/admin"):
-            admin_handler = self.handler_registry.get_handler("admin")
-            if admin_handler and admin_handler.can_handle(message) and admin_handler.enabled:
-                self.system_logger.debug("Route to admin handler")
-                return admin_handler
-            
-        # Use echo handler
-        if message.strip().startswith("/echo"):
-            echo_handler = self.handler_registry.get_handler("echo")
-            if echo_handler and echo_handler.can_handle(message) and echo_handler.enabled:
-                self.system_logger.debug("Route to echo handler")
-                return echo_handler
-
-        # Use file handler
-        if message.strip().startswith("/file"):
-            file_handler = self.handler_registry.get_handler("file")
-            if file_handler and file_handler.can_handle(message) and file_handler.enabled:
-                self.system_logger.debug("Route to file handler")
-                return file_handler
-            
-        # Use SGC handler
-        if message.strip().startswith("/sgc"):
-            sgc_handler = self.handler_registry.get_handler("sgc")
-            if sgc_handler and sgc_handler.can_handle(message) and sgc_handler.enabled:
-                self.system_logger.debug("Route to sgc handler")
-                return sgc_handler
-            
-        # Use REF handler
-        if message.strip().startswith("/ref"):
-            ref_handler = self.handler_registry.get_handler("ref")
-            if ref_handler and ref_handler.can_handle(message) and ref_handler.enabled:
-                self.system_logger.debug("Route to ref handler")
-                return ref_handler
-         
-        # Use llm handler
-        if message.strip().startswith("/llm"):
-            llm_handler = self.handler_registry.get_handler("llm")
-            if llm_handler and llm_handler.can_handle(message) and llm_handler.enabled:
-                self.system_logger.debug("Route to llm handler")
-                return llm_handler
-        
-        # Use help handler
-        if message.strip().startswith("/help"):
-            help_handler = self.handler_registry.get_handler("help")
-            if help_handler and help_handler.can_handle(message) and help_handler.enabled:
-                self.system_logger.debug("Route to help handler")
-                return help_handler
+        handler: Optional[BaseHandler] = self._router.resolve(message) if message else None
+        if handler and handler.enabled and handler.can_handle(message):
+            self.system_logger.debug(f"Route to {handler.name} handler")
+            return handler
             
         # Fallback to default handler
         self.system_logger.debug("Route to default handler")
@@ -547,6 +567,11 @@ class MSTeamsBot(ActivityHandler):
         Verifies whether an OpenAI Vector Store exists by its ID.
 
         Logs an informational message if the vector store is found, or a warning if not.
+        Successful checks are recorded in the vector store health file, keyed by the store ID
+        and a fingerprint of the API key; a store verified with the same key within the last
+        `vector_store_health_ttl` seconds is trusted without a new request, which keeps restarts
+        from paying one OpenAI round trip per store. A failed check drops the store's entries,
+        and a store renamed or replaced in the settings never matches an old entry.
 
         Args:
             openai_vector_store_id (str): The unique ID of the OpenAI Vector Store.
@@ -556,12 +581,32 @@ class MSTeamsBot(ActivityHandler):
         Returns:
             bool: True if the vector store exists, False otherwise.
         """
-        vector_store = check_vector_store_by_id(openai_vector_store_id, self.settings.openai_api_key)
+        health_path: str = self.settings.vector_store_health_path
+        health: Dict[str, float] = load_json(health_path)
+        # Entries are bound to the store and to the key that verified it; the key itself is never written
+        key_fingerprint: str = hashlib.sha256(self.settings.openai_api_key.encode("utf-8")).hexdigest()[:16]
+        health_key: str = f"{openai_vector_store_id}:{key_fingerprint}"
+        last_ok: Optional[float] = health.get(health_key)
+
+        if last_ok is not None and time.time() - last_ok < self.settings.vector_store_health_ttl:
+            if verbose:
+                self.system_logger.info(f"Vector Store {openai_vector_store_id} verified recently, skipping check.")
+            return True
+
+        vector_store = _get_vector_store(openai_vector_store_id, self.settings.openai_api_key)
         if vector_store:
+            health[health_key] = time.time()
+            save_json(health_path, health)
             if verbose:
                 self.system_logger.info(f"Vector Store found: {vector_store.name}")
             return True
         else:
+            # Forget every entry of this store, whichever key recorded it
+            stale_keys: List[str] = [key for key in health if key.split(":", 1)[0] == openai_vector_store_id]
+            for key in stale_keys:
+                del health[key]
+            if stale_keys:
+                save_json(health_path, health)
             if verbose:
                 self.system_logger.warning(f"Vector Store not found with ID: {openai_vector_store_id}.")
             return False
@@ -571,7 +616,9 @@ class MSTeamsBot(ActivityHandler):
         Gets or creates a logger instance specific to the user.
 
         This method ensures that each user has a dedicated logger for
-        recording their conversation interactions.
+        recording their conversation interactions. Only the most recently
+        active users keep their log files open; evicted loggers close them
+        and reopen them on their next write.
 
         Args:
             turn_context (TurnContext): The context for the conversation.
@@ -580,11 +627,14 @@ class MSTeamsBot(ActivityHandler):
             Logger: The logger instance configured for the user.
         """
         user_id, user_name = self._get_user_info(turn_context)
-        user_id = user_id.split(':')[1]
+        if user_id and ':' in user_id:
+            user_id = user_id.split(':')[1]
         if not user_id or not user_name:
             return self.system_logger
 
-        if user_id not in self.user_loggers:
-            self.user_loggers[user_id] = get_user_logger(user_id, user_name)
+        user_logger: Optional[Logger] = self.user_loggers.get(user_id)
+        if user_logger is None:
+            user_logger = get_user_logger(user_id, user_name)
+            self.user_loggers[user_id] = user_logger
 
-        return self.user_loggers[user_id]
\ No newline at end of file
+        return user_logger
\ No newline at end of file
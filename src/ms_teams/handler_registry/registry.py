@@ -1,5 +1,7 @@
 
-from typing import Dict, List, Optional, Any
+import threading
+
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from src.ms_teams.handlers.base_handler import BaseHandler
 
 from src.log.system_logger import Logger, get_system_logger
@@ -20,7 +22,17 @@ class HandlerRegistry:
     Attributes:
         handlers (Dict[str, BaseHandler]): A dictionary mapping unique handler names to their instances.
         default_handler (Optional[str]): The name of the currently designated default handler.
+        _default_handler_obj (Optional[BaseHandler]): The default handler instance, kept in sync with `default_handler`.
+        _first_name (Optional[str]): Name of the earliest registered handler still present, or None
+            if it must be recomputed. Used to pick a new default handler.
+        _items_snapshot (Tuple[Tuple[str, BaseHandler], ...]): Immutable copy of `handlers`, rebuilt on
+            every registration change so readers can iterate it without locking.
+        _names_cache (Optional[Tuple[str, ...]]): Handler names memoized by `get_handler_names`,
+            reset to None whenever the set of handlers changes.
+        _listeners (List[Callable[[], None]]): Callbacks run after every change to the registry.
         logger: An instance of a logger for class-specific logging.
+        _lock (threading.RLock): Serializes mutations. Lookups stay lock-free, relying on
+            dict reads being atomic and on the cached attributes being replaced as a whole.
     """
 
     def __init__(self):
@@ -29,6 +41,12 @@ class HandlerRegistry:
         """
         self.handlers: Dict[str, BaseHandler] = {}
         self.default_handler: Optional[str] = None
+        self._default_handler_obj: Optional[BaseHandler] = None
+        self._first_name: Optional[str] = None
+        self._items_snapshot: Tuple[Tuple[str, BaseHandler], ...] = ()
+        self._names_cache: Optional[Tuple[str, ...]] = None
+        self._listeners: List[Callable[[], None]] = []
+        self._lock: threading.RLock = threading.RLock()
         self.system_logger = get_system_logger(__name__)
 
     def register_handler(self, name: str, handler: BaseHandler, is_default: bool = False) -> None:
@@ -43,19 +61,29 @@ class HandlerRegistry:
             handler (BaseHandler): An instance of the handler to be registered.
             is_default (bool, optional): If True, sets this handler as the default. Defaults to False.
         """     
-        if not isinstance(handler, BaseHandler):
+        # Type check only in development builds; `python -O` strips it
+        if __debug__ and not isinstance(handler, BaseHandler):
             raise ValueError(f"Handler must inherit from BaseHandler")
         
-        if name in self.handlers:
-            self.system_logger.warning(f"Handler '{name}' already exists, replacing...")
-        
-        self.handlers[name] = handler
+        with self._lock:
+            # Single probe: inserts a new name, or returns the handler already registered under it
+            previous: BaseHandler = self.handlers.setdefault(name, handler)
+            if previous is not handler:
+                self.system_logger.warning("Handler '%s' already exists, replacing...", name)
+                self.handlers[name] = handler
+            self._items_snapshot = tuple(self.handlers.items())
+            self._names_cache = None
+            if self._first_name is None and len(self.handlers) == 1:
+                self._first_name = name
+            if name == self.default_handler:
+                self._default_handler_obj = handler
         
-        if is_default or not self.default_handler:
-            self.default_handler = name
-            self.system_logger.info(f"Set '{name}' as default handler")
+            if is_default or not self.default_handler:
+                self._set_default(name)
+                self.system_logger.info("Set '%s' as default handler", name)
         
-        self.system_logger.info(f"Registered handler: {name} ({handler.__class__.__name__})")
+            self.system_logger.info("Registered handler: %s (%s)", name, handler.__class__.__name__)
+            self._notify_listeners()
 
     def unregister_handler(self, name: str) -> bool:
         """
@@ -70,23 +98,30 @@ class HandlerRegistry:
         Returns:
             bool: True if the handler was successfully removed, False if it was not found.
         """
+        with self._lock:
+            if name not in self.handlers:
+                self.system_logger.warning("Handler '%s' not found for removal", name)
+                return False
         
-        if name not in self.handlers:
-            self.system_logger.warning(f"Handler '{name}' not found for removal")
-            return False
-        
-        del self.handlers[name]
+            del self.handlers[name]
+            self._items_snapshot = tuple(self.handlers.items())
+            self._names_cache = None
+            if name == self._first_name:
+                self._first_name = None
         
-        # If this was the default handler, clear default
-        if self.default_handler == name:
-            self.default_handler = None
-            # Set first available handler as default
-            if self.handlers:
-                self.default_handler = next(iter(self.handlers))
-                self.system_logger.info(f"New default handler: {self.default_handler}")
+            # If this was the default handler, clear default
+            if self.default_handler == name:
+                self._set_default(None)
+                # Set first available handler as default
+                if self.handlers:
+                    if self._first_name is None:
+                        self._first_name = next(iter(self.handlers))
+                    self._set_default(self._first_name)
+                    self.system_logger.info("New default handler: %s", self.default_handler)
         
-        self.system_logger.info(f"Unregistered handler: {name}")
-        return True
+            self.system_logger.info("Unregistered handler: %s", name)
+            self._notify_listeners()
+            return True
     
     def get_handler(self, name: str) -> Optional[BaseHandler]:
         """
@@ -107,10 +142,38 @@ class HandlerRegistry:
         Returns:
             Optional[BaseHandler]: The default handler instance if one is set, otherwise None.
         """
-        if self.default_handler:
-            return self.handlers.get(self.default_handler)
-        return None
+        return self._default_handler_obj
     
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Registers a callback run after handlers are registered, unregistered, enabled,
+        disabled or cleared, so components caching data derived from the handlers can
+        invalidate it.
+
+        Args:
+            listener (Callable[[], None]): The callback. It runs under the registry lock
+                                           and should only reset cached state.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def _notify_listeners(self) -> None:
+        """
+        Runs the change listeners.
+        """
+        for listener in self._listeners:
+            listener()
+
+    def _set_default(self, name: Optional[str]) -> None:
+        """
+        Updates the default handler name together with its cached instance.
+
+        Args:
+            name (Optional[str]): The name of the new default handler, or None to clear it.
+        """
+        self.default_handler = name
+        self._default_handler_obj = self.handlers.get(name) if name else None
+
     def set_default_handler(self, name: str) -> bool:
         """
         Sets a registered handler as the new default handler.
@@ -121,13 +184,14 @@ class HandlerRegistry:
         Returns:
             bool: True if the default handler was successfully changed, False if the handler was not found in the registry.
         """
-        if name not in self.handlers:
-            self.system_logger.error(f"Cannot set default: handler '{name}' not found")
-            return False
+        with self._lock:
+            if name not in self.handlers:
+                self.system_logger.error("Cannot set default: handler '%s' not found", name)
+                return False
         
-        self.default_handler = name
-        self.system_logger.info(f"Default handler changed to: {name}")
-        return True
+            self._set_default(name)
+            self.system_logger.info("Default handler changed to: %s", name)
+            return True
     
     def enable_handler(self, name: str) -> bool:
         """
@@ -141,12 +205,14 @@ class HandlerRegistry:
         Returns:
             bool: True if the handler was successfully enabled, False if not found.
         """
-        handler = self.get_handler(name)
-        if handler:
-            handler.enable()
-            self.system_logger.info(f"Handler '{name}' enabled")
-            return True
-        return False
+        with self._lock:
+            handler = self.get_handler(name)
+            if handler:
+                handler.enable()
+                self.system_logger.info("Handler '%s' enabled", name)
+                self._notify_listeners()
+                return True
+            return False
     
     def disable_handler(self, name: str) -> bool:
         """
@@ -160,12 +226,14 @@ class HandlerRegistry:
         Returns:
             bool: True if the handler was successfully disabled, False if not found.
         """
-        handler = self.get_handler(name)
-        if handler:
-            handler.disable()
-            self.system_logger.info(f"Handler '{name}' disabled")
-            return True
-        return False
+        with self._lock:
+            handler = self.get_handler(name)
+            if handler:
+                handler.disable()
+                self.system_logger.info("Handler '%s' disabled", name)
+                self._notify_listeners()
+                return True
+            return False
     
     def get_handler_names(self) -> List[str]:
         """
@@ -174,7 +242,11 @@ class HandlerRegistry:
         Returns:
             List[str]: A list containing the names of all handlers currently in the registry.
         """
-        return list(self.handlers.keys())
+        names: Optional[Tuple[str, ...]] = self._names_cache
+        if names is None:
+            names = tuple(name for name, _ in self._items_snapshot)
+            self._names_cache = names
+        return list(names)
     
     def get_handler_info(self) -> List[Dict[str, Any]]:
         """
@@ -186,7 +258,7 @@ class HandlerRegistry:
             List[Dict[str, Any]]: A list of dictionaries, where each dictionary contains information about a handler, including a key `is_default` indicating if it is the current default.
         """
         info_list = []
-        for name, handler in self.handlers.items():
+        for name, handler in self._items_snapshot:
             handler_info = handler.get_info()
             handler_info["is_default"] = (name == self.default_handler)
             info_list.append(handler_info)
@@ -197,10 +269,13 @@ class HandlerRegistry:
         """
         Retrieves a list of names for all currently enabled handlers.
 
+        The status is read from each handler, so it is correct even if a handler was
+        enabled or disabled directly instead of through the registry.
+
         Returns:
             List[str]: A list of names for handlers whose `enabled` attribute is True.
         """
-        return [name for name, handler in self.handlers.items() if handler.enabled]
+        return [name for name, handler in self._items_snapshot if handler.enabled]
     
     def get_disabled_handlers(self) -> List[str]:
         """
@@ -209,7 +284,7 @@ class HandlerRegistry:
         Returns:
             List[str]: A list of names for handlers whose `enabled` attribute is False.
         """
-        return [name for name, handler in self.handlers.items() if not handler.enabled]
+        return [name for name, handler in self._items_snapshot if not handler.enabled]
     
     def clear_all_handlers(self):
         """
@@ -217,6 +292,11 @@ class HandlerRegistry:
 
         This method removes all registered handlers and resets the default handler to None.
         """
-        self.handlers.clear()
-        self.default_handler = None
-        self.system_logger.info("All handlers cleared from registry")
\ No newline at end of file
+        with self._lock:
+            self.handlers.clear()
+            self._items_snapshot = ()
+            self._names_cache = None
+            self._first_name = None
+            self._set_default(None)
+            self.system_logger.info("All handlers cleared from registry")
+            self._notify_listeners()
\ No newline at end of file
@@ -0,0 +1,136 @@
+
+from typing import Dict, Optional
+
+from src.ms_teams.handlers.base_handler import BaseHandler, ends_command_token
+from src.log.system_logger import Logger, get_system_logger
+
+class _RadixNode:
+    """
+    A node of the compressed prefix trie used by `HandlerRouter`.
+
+    Attributes:
+        label (str): The characters on the edge leading to this node.
+        handler (Optional[BaseHandler]): The handler whose prefix ends at this node, if any.
+        edges (Dict[str, _RadixNode]): Child nodes keyed by the first character of their label.
+    """
+
+    __slots__ = ("label", "handler", "edges")
+
+    def __init__(self, label: str = "", handler: Optional[BaseHandler] = None):
+        """
+        Initializes a node with no children.
+
+        Args:
+            label (str, optional): The edge label. Defaults to an empty string (root).
+            handler (Optional[BaseHandler], optional): The handler ending at this node. Defaults to None.
+        """
+        self.label: str = label
+        self.handler: Optional[BaseHandler] = handler
+        self.edges: Dict[str, "_RadixNode"] = {}
+
+class HandlerRouter:
+    """
+    Resolves the handler responsible for a message from its leading "/prefix" command.
+
+    Command prefixes are stored in a compressed (radix) trie built once at startup:
+    chains of single-child nodes are merged into one edge labelled with the whole
+    substring. A lookup extracts the first token of the message and follows one edge
+    per shared prefix segment, so its cost depends on the length of the command only
+    and not on the number of registered handlers.
+
+    Features:
+        - Single routing table shared by all handlers
+        - Case-insensitive matching of the command token
+        - A command ends at the end of the message or at a non-word character,
+          so "/help", "/help tema" and "/help?" resolve to the same node
+
+    Attributes:
+        _root (_RadixNode): Root node of the trie, with an empty label.
+        system_logger (Logger): A logger for recording routing events.
+    """
+
+    def __init__(self):
+        """
+        Initializes the HandlerRouter with an empty trie.
+        """
+        self._root: _RadixNode = _RadixNode()
+        self.system_logger: Logger = get_system_logger(__name__)
+
+    def add_route(self, prefix: str, handler: BaseHandler) -> None:
+        """
+        Registers a command prefix for a handler.
+
+        Args:
+            prefix (str): The command prefix without the leading slash (e.g. "file").
+            handler (BaseHandler): The handler that processes the command.
+
+        Raises:
+            ValueError: If the prefix is empty.
+        """
+        if not prefix:
+            raise ValueError("Handler prefix cannot be empty")
+
+        key: str = prefix.lower()
+        node: _RadixNode = self._root
+        while key:
+            child: Optional[_RadixNode] = node.edges.get(key[0])
+            if child is None:
+                node.edges[key[0]] = _RadixNode(key, handler)
+                return
+
+            label: str = child.label
+            common: int = 1
+            limit: int = min(len(label), len(key))
+            while common < limit and label[common] == key[common]:
+                common += 1
+
+            if common < len(label):
+                # Split the edge at the end of the shared segment
+                split = _RadixNode(label[:common])
+                child.label = label[common:]
+                split.edges[child.label[0]] = child
+                node.edges[key[0]] = split
+                child = split
+
+            node = child
+            key = key[common:]
+
+        if node.handler is not None:
+            self.system_logger.warning("Route '/%s' already registered. Overwriting.", prefix)
+        node.handler = handler
+
+    def resolve(self, message: str) -> Optional[BaseHandler]:
+        """
+        Finds the handler whose prefix matches the command at the start of a message.
+
+        The trie is walked character by character from the slash, and the longest
+        registered prefix whose token ends there (see `ends_command_token`) wins.
+
+        Args:
+            message (str): The user's message text (e.g. "/file FR-GC-01").
+
+        Returns:
+            Optional[BaseHandler]: The matching handler, or None if the message does not
+                                   start with a registered command.
+        """
+        message = message.lstrip()
+        if not message.startswith("/"):
+            return None
+
+        node: _RadixNode = self._root
+        position: int = 1
+        match: Optional[BaseHandler] = None
+        while True:
+            if node.handler is not None and ends_command_token(message, position):
+                match = node.handler
+            if position >= len(message):
+                return match
+
+            child: Optional[_RadixNode] = node.edges.get(message[position].lower())
+            if child is None:
+                return match
+            end: int = position + len(child.label)
+            if message[position:end].lower() != child.label:
+                return match
+            position = end
+            node = child
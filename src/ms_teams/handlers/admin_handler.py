@@ -1,6 +1,7 @@
 import re
+import types
 
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Union
 from botbuilder.core import TurnContext, MessageFactory
 from botbuilder.core.teams import TeamsInfo
 from botbuilder.schema import Attachment
@@ -11,6 +12,45 @@ from src.auth.manager import AuthManager, UserRole, Permission
 from src.auth.middleware import AuthMiddleware
 from src.log.system_logger import Logger, get_system_logger
 
+# Expresión regular para capturar:
+# 1. ID: uno o más caracteres alfanuméricos (incluyendo ':', '-') al principio
+# 2. Nombre: cualquier cosa entre comillas dobles
+# 3. Email: formato estándar de dirección de email
+# 4. Tipo de usuario/rol: una palabra al final
+_USER_RE: re.Pattern = re.compile(r'([\w:-]+)\s+"([^"]+)"\s+([\w\.-]+@[\w\.-]+)\s+(\w+)')
+
+# Respuestas fijas de los comandos
+_RESP_STATUS_NOT_IMPLEMENTED: str = "NO IMPLEMENTADO: Estado del sistema."
+_RESP_USERS_NOT_IMPLEMENTED: str = "NO IMPLEMENTADO: Listar usuarios."
+_RESP_CANNOT_REMOVE_SELF: str = "**No puedes remover tu propia cuenta de administrador.**"
+_RESP_NO_MEMBERS: str = "No se encontraron miembros en este chat."
+
+# Plantillas de respuesta de los comandos
+_ADD_OK_TMPL: str = (
+    "**Usuario agregado exitosamente**\n\n"
+    "- **Nombre:** {name}\n\n"
+    "- **ID:** {uid}\n\n"
+    "- **Email:** {email}\n\n"
+    "- **Rol:** {role}\n\n"
+    "- **Agregado por:** {admin}"
+)
+_REMOVE_OK_TMPL: str = (
+    "**Usuario removido exitosamente**\n\n"
+    "- **Nombre:** {name}\n\n"
+    "- **ID:** {uid}\n\n"
+    "- **Email:** {email}\n\n"
+    "- **Rol:** {role}\n\n"
+    "- **Removido por:** {admin}"
+)
+_ROLE_OK_TMPL: str = (
+    "**Rol actualizado exitosamente**\n\n"
+    "- **Usuario:** {name}\n\n"
+    "- **ID:** {uid}\n\n"
+    "- **Rol anterior:** {old_role}\n\n"
+    "- **Rol nuevo:** {new_role}\n\n"
+    "- **Actualizado por:** {admin}"
+)
+
 class AdminHandler(BaseHandler):
     """
     Handles administrative commands for user and system management.
@@ -32,8 +72,8 @@ class AdminHandler(BaseHandler):
         prefix (str): The command prefix used to trigger this handler, e.g., "admin".
         permission (Permission): The required permission level for a user to access this handler.
         system_logger (Logger): A logger for recording system and command events.
-        commands (Dict[str, Callable]): A mapping of command strings to their
-                                        corresponding handler methods.
+        _COMMAND_METHODS (MappingProxyType): Class-level, read-only mapping of command
+                                             strings to the names of their handler methods.
 
     Available commands:
         - /{prefix} status - System status
@@ -43,6 +83,17 @@ class AdminHandler(BaseHandler):
         - /{prefix} role <user_id> <new_role> - Change role
         - /{prefix} members - List all members of the current chat
     """
+
+    # Mapeo de comandos a los nombres de sus métodos, compartido por todas las instancias
+    _COMMAND_METHODS: types.MappingProxyType = types.MappingProxyType({
+        "status": "_cmd_status",
+        "users": "_cmd_users",
+        "add": "_cmd_add_user",
+        "remove": "_cmd_remove_user",
+        "role": "_cmd_change_role",
+        "members": "_cmd_members",
+    })
+
     def __init__(
             self,
             auth_manager: AuthManager,
@@ -72,15 +123,23 @@ class AdminHandler(BaseHandler):
         self.permission: Permission = permission
         self.system_logger: Logger = get_system_logger(__name__)
 
-        # Mapeo de comandos
-        self.commands = {
-            "status": self._cmd_status,
-            "users": self._cmd_users,
-            "add": self._cmd_add_user,
-            "remove": self._cmd_remove_user,
-            "role": self._cmd_change_role,
-            "members": self._cmd_members,
-        }
+        # Textos fijos que solo dependen del prefijo
+        self._usage_add: str = (
+            "Uso incorrecto\n\n"
+            f"- **Formato:** `/{self.prefix} add <user_id> <name> <email> <role>`\n\n"
+            "- **Roles disponibles:** admin, medic, user, guest"
+        )
+        self._usage_remove: str = f"**Uso incorrecto:** `/{self.prefix} remove <user_id>`"
+        self._usage_role: str = (
+            "**Uso incorrecto**\n\n\n"
+            f"**Formato:** `/{self.prefix} role <user_id> <new_role>`\n\n\n"
+            "**Roles disponibles:** admin, medic, user, guest, banned"
+        )
+        self._unknown_tmpl: str = (
+            f"**Comando desconocido:** `/{self.prefix} {{command}}`. "
+            f"Usa `/{self.prefix} help` para ver los comandos disponibles."
+        )
+        self._help_dict: Dict[str, Any] = self._build_help()
 
     async def handle_message(self, turn_context: TurnContext) -> Optional[Union[str, Attachment]]:
         """
@@ -101,6 +160,15 @@ class AdminHandler(BaseHandler):
         if not self.enabled:
             return None
 
+        message = self._get_user_message(turn_context)
+
+        # Descartar mensajes que no son comandos de admin antes de autenticar
+        if not self._matches_command(message):
+            return None
+
+        # Parsear comando: "/<prefix> <command> <args>"
+        parts: List[str] = message.strip().split(None, 2)
+
         # Verificar autenticación y permisos de admin
         is_authorized, error_msg = await self.auth_middleware.process_message(
             turn_context,
@@ -110,34 +178,29 @@ class AdminHandler(BaseHandler):
         if not is_authorized:
             return error_msg
 
-        message = self._get_user_message(turn_context)
-
-        # Parsear comando
-        parts = message.strip().split(maxsplit=2)
-        if len(parts) < 2 or parts[0].lower() != f"/{self.prefix}":
+        # "/<prefix>" sin subcomando
+        if len(parts) < 2:
             return None
 
         command = parts[1].lower()
         args = parts[2] if len(parts) > 2 else ""
 
-        user_info = self.auth_middleware.get_user_info(turn_context)
+        user_info: Optional[Dict[str, Any]] = self.auth_middleware.get_user_info(turn_context)
         user_name = user_info['name'] if user_info else "Unknown"
         user_role = user_info['role'] if user_info else "Unknown"
 
-        self.system_logger.info(
-            f"ADMIN - User: {user_name} ({user_role}) "
-            f"Command: {command}"
-        )
+        self.system_logger.info("ADMIN - User: %s (%s) Command: %s", user_name, user_role, command)
 
         # Ejecutar comando
-        if command in self.commands:
-            try:
-                return await self.commands[command](args, turn_context)
-            except Exception as e:
-                self.system_logger.error(f"Error executing admin command '{command}': {e}", exc_info=True)
-                return f"Error ejecutando comando '{command}': {str(e)}"
-        else:
+        method_name: Optional[str] = self._COMMAND_METHODS.get(command)
+        if method_name is None:
             return self._format_unknown_command(command)
+
+        try:
+            return await getattr(self, method_name)(args, turn_context, user_info)
+        except Exception as e:
+            self.system_logger.error("Error executing admin command '%s': %s", command, e, exc_info=True)
+            return f"Error ejecutando comando '{command}': {str(e)}"
         
     def _format_unknown_command(self, command: str) -> str:
         """
@@ -149,9 +212,9 @@ class AdminHandler(BaseHandler):
         Returns:
             str: A formatted error message.
         """
-        return f"**Comando desconocido:** `/{self.prefix} {command}`. Usa `/{self.prefix} help` para ver los comandos disponibles.".strip()
+        return self._unknown_tmpl.format(command=command)
     
-    async def _cmd_status(self, args:str, turn_context: TurnContext) -> str:
+    async def _cmd_status(self, args: str, turn_context: TurnContext, user_info: Optional[Dict[str, Any]] = None) -> str:
         """
         Handles the "/{prefix} status" command.
 
@@ -160,14 +223,15 @@ class AdminHandler(BaseHandler):
         Args:
             args (str): The command arguments (not used).
             turn_context (TurnContext): The Bot Framework turn context.
+            user_info (Optional[Dict[str, Any]]): The calling user's information (not used).
 
         Returns:
             str: A message indicating that the command is not implemented.
         """
-        self.system_logger.warning(f"Command /{self.prefix} status requested, but not implemented.")
-        return "NO IMPLEMENTADO: Estado del sistema."
+        self.system_logger.warning("Command /%s status requested, but not implemented.", self.prefix)
+        return _RESP_STATUS_NOT_IMPLEMENTED
     
-    async def _cmd_users(self, args: str, turn_context: TurnContext) -> str:
+    async def _cmd_users(self, args: str, turn_context: TurnContext, user_info: Optional[Dict[str, Any]] = None) -> str:
         """
         Handles the "/{prefix} users" command.
 
@@ -177,46 +241,43 @@ class AdminHandler(BaseHandler):
         Args:
             args (str): The command arguments (not used).
             turn_context (TurnContext): The Bot Framework turn context.
+            user_info (Optional[Dict[str, Any]]): The calling user's information (not used).
 
         Returns:
             str: A message indicating that the command is not implemented.
         """
-        self.system_logger.warning(f"Command /{self.prefix} users requested, but not implemented.")
-        return "NO IMPLEMENTADO: Listar usuarios."
+        self.system_logger.warning("Command /%s users requested, but not implemented.", self.prefix)
+        return _RESP_USERS_NOT_IMPLEMENTED
     
-    async def _cmd_add_user(self, args, turn_context: TurnContext) -> str:
+    async def _cmd_add_user(self, args: str, turn_context: TurnContext, user_info: Optional[Dict[str, Any]] = None) -> str:
         """
         Handles the "/{prefix} add <user_id> <"name"> <email> <role>" command to add a new authorized user.
 
         Args:
             args (str): A string containing the user ID, name, email, and role.
-            turn_context (TurnContext): The Bot Framework turn context to get the admin's info.
+            turn_context (TurnContext): The Bot Framework turn context.
+            user_info (Optional[Dict[str, Any]]): The calling admin's information, resolved once per turn.
 
         Returns:
             str: A success or error message confirming the operation.
         """
         args = self._parse_user_string(args)
         if args is None:
-            error_message = f"""
-            Uso incorrecto\n
-            - **Formato:** `/{self.prefix} add <user_id> <name> <email> <role>`\n
-            - **Roles disponibles:** admin, medic, user, guest
-            """
-            return error_message.strip()
+            return self._usage_add
         
         user_id, user_name, user_email, role_str = args
-        admin_info = self.auth_middleware.get_user_info(turn_context)
+        admin_info = user_info
         admin_name = admin_info['name'] if admin_info else "Unknown Admin"
 
         # Validar rol
         try:
             user_role = UserRole(role_str.lower())
         except ValueError:
-            return f"**Rol inválido:** `{role_str}`. **Roles válidos:** admin, user, guest".strip()
+            return f"**Rol inválido:** `{role_str}`. **Roles válidos:** admin, user, guest"
 
         # Verificar si ya existe
         if user_id in self.auth_manager.authorized_users:
-            return f"**Usuario ya existe:** {user_name} (`{user_id}`)".strip()
+            return f"**Usuario ya existe:** {user_name} (`{user_id}`)"
         
         # Agregar usuario
         success = self.auth_manager.add_authorized_user(
@@ -228,26 +289,22 @@ class AdminHandler(BaseHandler):
         )
         
         if success:
-            self.system_logger.info(f"User added: {user_name} ({user_id}) by {admin_name}")
-            return f"""
-            **Usuario agregado exitosamente**\n
-            - **Nombre:** {user_name}\n
-            - **ID:** {user_id}\n
-            - **Email:** {user_email}\n
-            - **Rol:** {user_role.value}\n
-            - **Agregado por:** {admin_name}
-            """.strip()
+            self.system_logger.info("User added: %s (%s) by %s", user_name, user_id, admin_name)
+            return _ADD_OK_TMPL.format(
+                name=user_name, uid=user_id, email=user_email, role=user_role.value, admin=admin_name
+            )
         else:
-            self.system_logger.error(f"Error adding user: {user_name} ({user_id})")
+            self.system_logger.error("Error adding user: %s (%s)", user_name, user_id)
             return f"**Error agregando usuario:** {user_name} (`{user_id}`)"
         
-    async def _cmd_remove_user(self, args:str, turn_context: TurnContext) -> str:
+    async def _cmd_remove_user(self, args: str, turn_context: TurnContext, user_info: Optional[Dict[str, Any]] = None) -> str:
         """
         Handles the "/{prefix} remove <user_id>" command to remove an authorized user.
 
         Args:
             args (str): The user ID of the user to remove.
-            turn_context (TurnContext): The Bot Framework turn context to get the admin's info.
+            turn_context (TurnContext): The Bot Framework turn context.
+            user_info (Optional[Dict[str, Any]]): The calling admin's information, resolved once per turn.
 
         Returns:
             str: A success or error message confirming the operation.
@@ -255,27 +312,22 @@ class AdminHandler(BaseHandler):
         args = args.strip().split()
 
         if len(args) != 1:
-            return f"**Uso incorrecto:** `/{self.prefix} remove <user_id>`".strip()
+            return self._usage_remove
         
         user_id = args[0]
         
         # Verificar que existe
-        if user_id not in self.auth_manager.authorized_users:
-            error_message = f"**Usuario no encontrado:** `{user_id}`"
-            return error_message.strip()
+        user_data: Optional[Dict[str, Any]] = self.auth_manager.authorized_users.get(user_id)
+        if user_data is None:
+            return f"**Usuario no encontrado:** `{user_id}`"
         
-        user_id = args[0]
-        admin_info = self.auth_middleware.get_user_info(turn_context)
+        admin_info = user_info
         admin_id = admin_info['user_id'] if admin_info else ""
         admin_name = admin_info['name'] if admin_info else "Unknown Admin"
 
         if user_id == admin_id:
-            return "**No puedes remover tu propia cuenta de administrador.**".strip()
-
-        if user_id not in self.auth_manager.authorized_users:
-            return f"**Usuario no encontrado:** `{user_id}`".strip()
+            return _RESP_CANNOT_REMOVE_SELF
 
-        user_data = self.auth_manager.authorized_users[user_id]
         user_name = user_data.get("name", "Unknown")
         user_email = user_data.get("email", "")
         user_role = user_data.get("role", "")
@@ -283,26 +335,22 @@ class AdminHandler(BaseHandler):
         success = self.auth_manager.remove_authorized_user(user_id, admin_name)
 
         if success:
-            self.system_logger.info(f"User removed: {user_name} ({user_id}) by {admin_name}")
-            return f"""
-            **Usuario removido exitosamente**\n
-            - **Nombre:** {user_name}\n
-            - **ID:** {user_id}\n
-            - **Email:** {user_email}\n
-            - **Rol:** {user_role.value}\n
-            - **Removido por:** {admin_name}
-            """.strip()
+            self.system_logger.info("User removed: %s (%s) by %s", user_name, user_id, admin_name)
+            return _REMOVE_OK_TMPL.format(
+                name=user_name, uid=user_id, email=user_email, role=user_role, admin=admin_name
+            )
         else:
-            self.system_logger.error(f"Error removing user: {user_name} ({user_id})")
+            self.system_logger.error("Error removing user: %s (%s)", user_name, user_id)
             return f"**Error removiendo usuario:** {user_name} (`{user_id}`)"
         
-    async def _cmd_change_role(self, args:str, turn_context: TurnContext) -> str:
+    async def _cmd_change_role(self, args: str, turn_context: TurnContext, user_info: Optional[Dict[str, Any]] = None) -> str:
         """
         Handles the "/{prefix} role <user_id> <new_role>" command to change an existing user's role.
 
         Args:
             args (str): A string containing the user ID and the new role.
-            turn_context (TurnContext): The Bot Framework turn context to get the admin's info.
+            turn_context (TurnContext): The Bot Framework turn context.
+            user_info (Optional[Dict[str, Any]]): The calling admin's information, resolved once per turn.
 
         Returns:
             str: A success or error message confirming the role change.
@@ -310,27 +358,22 @@ class AdminHandler(BaseHandler):
         args = args.strip().split()
         
         if len(args) != 2:
-            error_message = f"""
-            **Uso incorrecto**\n\n
-            **Formato:** `/{self.prefix} role <user_id> <new_role>`\n\n
-            **Roles disponibles:** admin, medic, user, guest, banned
-            """
-            return error_message.strip()
+            return self._usage_role
         
         user_id = args[0]
         role_str = args[1].lower()
-        admin_info = self.auth_middleware.get_user_info(turn_context)
+        admin_info = user_info
         admin_name = admin_info['name'] if admin_info else "Unknown Admin"
         
         # Validar rol
         try:
             new_role = UserRole(role_str)
         except ValueError:
-            return f"**Rol inválido:** `{role_str}`. **Roles válidos:** admin, medic, user, guest, banned".strip()
+            return f"**Rol inválido:** `{role_str}`. **Roles válidos:** admin, medic, user, guest, banned"
 
         # Verificar que el usuario existe
         if user_id not in self.auth_manager.authorized_users:
-            return f"**Usuario no encontrado:** `{user_id}`".strip()
+            return f"**Usuario no encontrado:** `{user_id}`"
 
         # Obtener información del usuario
         user_data = self.auth_manager.authorized_users[user_id]
@@ -342,21 +385,16 @@ class AdminHandler(BaseHandler):
 
         if success:
             self.system_logger.info(
-                f"Role updated for {user_name} ({user_id}): from {old_role} to {new_role.value} by {admin_name}"
+                "Role updated for %s (%s): from %s to %s by %s", user_name, user_id, old_role, new_role.value, admin_name
+            )
+            return _ROLE_OK_TMPL.format(
+                name=user_name, uid=user_id, old_role=old_role, new_role=new_role.value, admin=admin_name
             )
-            return f"""
-            **Rol actualizado exitosamente**\n
-            - **Usuario:** {user_name}\n
-            - **ID:** {user_id}\n
-            - **Rol anterior:** {old_role}\n
-            - **Rol nuevo:** {new_role.value}\n
-            - **Actualizado por:** {admin_name}
-            """.strip()
         else:
-            self.system_logger.error(f"Error updating role for: {user_name} ({user_id})")
+            self.system_logger.error("Error updating role for: %s (%s)", user_name, user_id)
             return f"**Error actualizando rol para:** {user_name} (`{user_id}`)"
     
-    async def _cmd_members(self, args: str, turn_context: TurnContext) -> str:
+    async def _cmd_members(self, args: str, turn_context: TurnContext, user_info: Optional[Dict[str, Any]] = None) -> str:
         """
         Handles the "/{prefix} members" command.
 
@@ -366,25 +404,26 @@ class AdminHandler(BaseHandler):
         Args:
             args (str): The command arguments (not used).
             turn_context (TurnContext): The Bot Framework turn context.
+            user_info (Optional[Dict[str, Any]]): The calling user's information (not used).
 
         Returns:
             str: A formatted list of chat members with their IDs and names.
         """
         members = await TeamsInfo.get_members(turn_context)
         if not members:
-            return "No se encontraron miembros en este chat."
+            return _RESP_NO_MEMBERS
 
         count = len(members)
         header = f"Se encontraron {count} usuario{'s' if count != 1 else ''} en este chat:\n"
-        members_info = [f"- **{m.name}** | {m.id}" for m in members]
 
-        return header + "\n".join(members_info)
+        return header + "\n".join(f"- **{m.name}** | {m.id}" for m in members)
     
     def can_handle(self, message: str, context: Dict[str, Any] = None) -> bool:
         """
         Determines if the handler can process the given message.
 
         This method checks if the message begins with the "/{prefix}" prefix.
+        The command token follows the same rule as the router (see `ends_command_token`).
 
         Args:
             message (str): The user's message text.
@@ -394,7 +433,7 @@ class AdminHandler(BaseHandler):
         Returns:
             bool: `True` if the message starts with "/{prefix}", otherwise `False`.
         """
-        return message.strip().lower().startswith(f"/{self.prefix}")
+        return self._matches_command(message)
     
     @staticmethod
     def _list_to_string_with_spaces(string_list: list) -> str:
@@ -426,26 +465,24 @@ class AdminHandler(BaseHandler):
             Optional[list[str]]: A list containing the parsed user ID, name, email, and role.
                                 Returns `None` if the string format is incorrect.
         """
-        # Expresión regular para capturar:
-        # 1. ID: uno o más caracteres alfanuméricos (incluyendo ':', '-') al principio
-        # 2. Nombre: cualquier cosa entre comillas dobles
-        # 3. Email: formato estándar de dirección de email
-        # 4. Tipo de usuario/rol: una palabra al final
-        match = re.search(r'([\w:-]+)\s+"([^"]+)"\s+([\w\.-]+@[\w\.-]+)\s+(\w+)', user_string)
-
-        if match:
-            user_id = match.group(1)
-            name = match.group(2)
-            email = match.group(3)
-            user_type = match.group(4)
-            return [user_id, name, email, user_type]
-        else:
-            return None
+        match = _USER_RE.search(user_string)
+        return list(match.groups()) if match else None
         
     def get_help(self) -> Dict[str, Any]:
         """
         Returns a detailed help dictionary for the AdminHandler.
 
+        The dictionary is built once at construction and shared; callers must not modify it.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing structured help information.
+        """
+        return self._help_dict
+
+    def _build_help(self) -> Dict[str, Any]:
+        """
+        Builds the help dictionary returned by `get_help`.
+
         Returns:
             Dict[str, Any]: A dictionary containing structured help information.
         """
@@ -2,6 +2,26 @@ from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any
 from botbuilder.core import TurnContext
 
+def ends_command_token(text: str, index: int) -> bool:
+    """
+    Checks whether a "/prefix" command token ending at `index` is complete.
+
+    A command ends at the end of the text or at any non-word character, so "/help",
+    "/help me" and "/help?" match the "help" command while "/helpme" does not. This is
+    the single token rule shared by the router and by `BaseHandler._matches_command`.
+
+    Args:
+        text (str): The message text.
+        index (int): The position right after the candidate command token.
+
+    Returns:
+        bool: `True` if the token ends at `index`, otherwise `False`.
+    """
+    if index >= len(text):
+        return True
+    char: str = text[index]
+    return not (char.isalnum() or char == "_")
+
 class BaseHandler(ABC):
     """
     Represents a foundational component for handling messages within a system.
@@ -21,7 +41,11 @@ class BaseHandler(ABC):
         prefix (str): The command prefix used to trigger this handler.
         description (str): A brief description of the handler's purpose.
         enabled (bool): A flag indicating whether the handler is active.
+        _cmd_token_lower (str): The lowercased "/{prefix}" command token, built once.
+        _cmd_token_len (int): Length of `_cmd_token_lower`.
     """
+
+    __slots__ = ("name", "prefix", "description", "enabled", "_cmd_token_lower", "_cmd_token_len")
     
     def __init__(self, name: str, prefix: str, description: str = ""):
         """
@@ -37,6 +61,8 @@ class BaseHandler(ABC):
         self.prefix: str = prefix
         self.description: str = description
         self.enabled: bool = True
+        self._cmd_token_lower: str = f"/{prefix}".lower()
+        self._cmd_token_len: int = len(self._cmd_token_lower)
     
     @abstractmethod
     async def handle_message(self, turn_context: TurnContext) -> Optional[str]:
@@ -74,6 +100,23 @@ class BaseHandler(ABC):
         """
         pass
 
+    def _matches_command(self, message: str) -> bool:
+        """
+        Checks whether a message starts with this handler's "/{prefix}" command.
+
+        The comparison is case-insensitive, only lowercases the leading slice, and
+        applies the token rule of `ends_command_token`.
+
+        Args:
+            message (str): The user's message text.
+
+        Returns:
+            bool: `True` if the message starts with the command token, otherwise `False`.
+        """
+        stripped: str = message.lstrip()
+        token_len: int = self._cmd_token_len
+        return stripped[:token_len].lower() == self._cmd_token_lower and ends_command_token(stripped, token_len)
+
     @abstractmethod
     def get_help(self) -> Dict[str, Any]:
         """
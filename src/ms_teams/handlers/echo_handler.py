@@ -1,4 +1,7 @@
-from datetime import datetime
+import re
+import time
+import types
+
 from typing import Optional, Dict, Any
 from botbuilder.core import TurnContext
 from logging import Logger
@@ -8,6 +11,19 @@ from src.auth.manager import Permission
 from src.auth.middleware import AuthMiddleware
 from src.log.system_logger import Logger, get_system_logger
 
+LOG: Logger = get_system_logger(__name__)
+
+# Runs of whitespace collapsed by `_pre_process`
+_WS_RE = re.compile(r"\s+")
+
+# Emoji shown next to the user name, by role (read-only)
+_ROLE_EMOJIS: types.MappingProxyType = types.MappingProxyType({
+    "admin": "👑",
+    "user": "👤",
+    "guest": "👥",
+    "banned": "🚫" # Añadido para consistencia con UserRole
+})
+
 class EchoHandler(BaseHandler):
     """
     Manages the "echo" functionality with built-in authentication.
@@ -29,6 +45,9 @@ class EchoHandler(BaseHandler):
         permission (Permission): The required permission level for a user to access this handler.
         system_logger (Logger): A logger for recording system and user activity.
     """
+
+    __slots__ = ("auth_middleware", "permission", "system_logger")
+
     def __init__(
             self,
             auth_middleware: AuthMiddleware,
@@ -53,14 +72,14 @@ class EchoHandler(BaseHandler):
         )
         self.auth_middleware: AuthMiddleware = auth_middleware
         self.permission: Permission = permission
-        self.system_logger: Logger = get_system_logger(__name__)
+        self.system_logger: Logger = LOG
 
     async def handle_message(self, turn_context: TurnContext) -> Optional[str]:
         """
         Handles incoming messages for the Echo handler.
 
-        This method first checks for user authorization and then determines
-        if the message is prefixed with "/{prefix}". Before processing the message and generating a response.
+        This method first determines if the message is prefixed with "/{prefix}" and
+        then checks for user authorization, before processing the message and generating a response.
 
         Args:
             turn_context (TurnContext): The Bot Framework turn context.
@@ -72,6 +91,11 @@ class EchoHandler(BaseHandler):
         if not self.enabled:
             return None
 
+        # Cheap prefix check first, so messages for other handlers skip authentication
+        message = (self._get_user_message(turn_context) or "").strip()
+        if not self._matches_command(message):
+            return None
+
         is_authorized, error_msg = await self.auth_middleware.process_message(
             turn_context,
             Permission.USE_ECHO
@@ -80,9 +104,8 @@ class EchoHandler(BaseHandler):
         if not is_authorized:
             return error_msg
 
-        message = self._get_user_message(turn_context)
-
-        cleaned_message = message.removeprefix(f"/{self.prefix}").strip() 
+        # Drop the "/{prefix}" token and the whitespace around the echoed text
+        cleaned_message = message[self._cmd_token_len:].strip()
 
         return await self._process_echo(cleaned_message, turn_context)
 
@@ -109,10 +132,9 @@ class EchoHandler(BaseHandler):
             if not user_info:
                 return "Error obteniendo información de usuario."
             
-            self.system_logger.debug(
-            f"Echo - User: {user_name} ({user_role}) "
-            f"Message: {message}"
-        )
+            LOG.debug(
+                "Echo - User: %s (%s) Message: %s", user_name, user_role, message
+            )
 
             processed_message = await self._pre_process(message, turn_context)
 
@@ -123,15 +145,14 @@ class EchoHandler(BaseHandler):
 
             final_response = await self._post_process(echo_response, message, turn_context)
 
-            self.system_logger.debug(
-                f"Echo - Response: {user_name} ({user_role}) "
-                f"Response: {processed_message}"
+            LOG.debug(
+                "Echo - Response: %s (%s) Response: %s", user_name, user_role, processed_message
             )
 
             return final_response
 
         except Exception as e:
-            self.system_logger.error(f"Error in EchoHandler: {e}", exc_info=True)
+            LOG.error("Error in EchoHandler: %s", e, exc_info=True)
             return "Error procesando tu mensaje. Por favor intenta de nuevo."
 
     
@@ -149,27 +170,18 @@ class EchoHandler(BaseHandler):
         Returns:
             str: The formatted response with user and echo information.
         """
-        role_emojis = {
-            "admin": "👑",
-            "user": "👤",
-            "guest": "👥",
-            "banned": "🚫" # Añadido para consistencia con UserRole
-        }
-
         # Obtener el emoji basado en el rol del usuario, con un valor por defecto
-        role_emoji = role_emojis.get(user_info.get("role", "guest"), "👤")
-
-        # Construir la respuesta base
-        response = f"🤖 **MSBot - Modo Echo**\n\n"
-
-        # Añadir información del usuario
-        response += f"{role_emoji} **Usuario:** {user_info.get('name', 'Usuario')}\n\n"
-        response += f"🎭 **Rol:** {user_info.get('role', 'unknown').title()}\n\n"
-
-        # Añadir la respuesta de eco
-        response += f"🔄 **Respuesta Echo:** {message}\n\n"
-
-        return response
+        role_emoji = _ROLE_EMOJIS.get(user_info.get("role", "guest"), "👤")
+        name = user_info.get('name', 'Usuario')
+        role_title = user_info.get('role', 'unknown').title()
+
+        # Construir la respuesta con la información del usuario y el eco
+        return (
+            f"🤖 **MSBot - Modo Echo**\n\n"
+            f"{role_emoji} **Usuario:** {name}\n\n"
+            f"🎭 **Rol:** {role_title}\n\n"
+            f"🔄 **Respuesta Echo:** {message}\n\n"
+        )
     
     async def _pre_process(self, message: str, turn_context: TurnContext) -> str:
         """
@@ -185,9 +197,7 @@ class EchoHandler(BaseHandler):
         Returns:
             str: The pre-processed message.
         """
-        cleaned = message.strip()
-        cleaned = ' '.join(cleaned.split()) # Elimina espacios múltiples
-        return cleaned
+        return _WS_RE.sub(" ", message).strip() # Elimina espacios múltiples y de los extremos
     
     async def _post_process(self, response: str, original_message: str, turn_context: TurnContext) -> str:
         """
@@ -204,7 +214,8 @@ class EchoHandler(BaseHandler):
         Returns:
             str: The final, formatted response for the user.
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        now = time.localtime()
+        timestamp = f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
         final_response = response + f"\n\n⏰ **Procesado:** {timestamp}"
 
         return final_response
@@ -224,7 +235,7 @@ class EchoHandler(BaseHandler):
         Returns:
             bool: `True` if the message starts with "/{prefix}", otherwise `False`.
         """
-        return message.strip().lower().startswith(f"/{self.prefix}")
+        return self._matches_command(message)
     
     def get_help(self) -> Dict[str, Any]:
         """
@@ -1,5 +1,6 @@
-import re
+import os
 import time
+import threading
 
 from pathlib import Path
 from typing import Optional, Dict, Any, Union, List, Tuple
@@ -16,6 +17,75 @@ from src.log.system_logger import Logger, get_system_logger
 from src.utils.json import load_json
 from src.utils.txt import load_txt
 
+LOG: Logger = get_system_logger(__name__)
+
+# Shared results for index misses, never mutated
+_EMPTY_GROUP: Dict[str, List[Dict[str, str]]] = {}
+_EMPTY_DOCS: List[Dict[str, str]] = []
+
+# Respuestas fijas, completadas con .format()
+_INVALID_CODE_TMPL: str = "Formato de código no válido: {command}. Ejemplo: FR-GC-01"
+_NOT_FOUND_TMPL: str = "No se encontraron documentos para el código `{code}`."
+
+def _is_valid_code(code: str) -> bool:
+    """
+    Checks that a document code has the `XX-XX-NN` shape (e.g. "FR-GC-01").
+
+    Equivalent to matching `^[A-Z]{2}-[A-Z]{2}-\\d{2}$` against an upper-cased code, but
+    the shape is fixed so a few slice checks are cheaper than a regex match.
+
+    Args:
+        code (str): The upper-cased document code.
+
+    Returns:
+        bool: True if the code is well formed, otherwise False.
+    """
+    return (
+        len(code) == 8
+        and code.isascii()
+        and code[2] == "-"
+        and code[5] == "-"
+        and code[:2].isalpha()
+        and code[3:5].isalpha()
+        and code[6:].isdigit()
+    )
+
+def _token_end(text: str, start: int = 0) -> int:
+    """
+    Finds where the whitespace-delimited token starting at `start` ends.
+
+    Args:
+        text (str): The text to scan.
+        start (int): The position of the token's first character.
+
+    Returns:
+        int: The index of the first whitespace character at or after `start`,
+             or `len(text)` if there is none.
+    """
+    for index in range(start, len(text)):
+        if text[index].isspace():
+            return index
+    return len(text)
+
+def _build_document_index(data: Dict[str, List[Dict[str, str]]]) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
+    """
+    Groups a flat code -> documents mapping by the `XX-XX` part of each code.
+
+    For example, `{"FR-GC-01": [...], "FR-GC-02": [...]}` becomes
+    `{"FR-GC": {"01": [...], "02": [...]}}`.
+
+    Args:
+        data (Dict[str, List[Dict[str, str]]]): The document index as stored on disk.
+
+    Returns:
+        Dict[str, Dict[str, List[Dict[str, str]]]]: The index nested by code group and number.
+    """
+    index: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
+    for code, docs in data.items():
+        group, _, number = code.rpartition("-")
+        index.setdefault(group, {})[number] = docs
+    return index
+
 class FileHandler(BaseHandler):
     """
     Handles file lookup requests from a JSON index based on document codes.
@@ -37,10 +107,27 @@ class FileHandler(BaseHandler):
         prefix (str): Command prefix to trigger this handler (e.g., "file").
         permission (Permission): The required permission to access this handler.
         system_logger (Logger): A logger for recording system events and errors.
-        data (Dict[str, Any]): The in-memory representation of the loaded JSON index.
+        data (Dict[str, Dict[str, List[Dict[str, str]]]]): The loaded JSON index, nested by code
+            group (e.g. "FR-GC") and code number (e.g. "01"). Loaded on first use and reloaded
+            when the file's modification time changes.
         stats_manager (StatsManager): Manages the logging of usage statistics.
     """
 
+    __slots__ = (
+        "settings",
+        "auth_manager",
+        "auth_middleware",
+        "permission",
+        "system_logger",
+        "stats_manager",
+        "_data_cache",
+        "_data_mtime",
+        "_data_lock",
+        "_common_documents",
+        "_common_template",
+        "_common_codes_cached",
+    )
+
     def __init__(
         self,
         auth_manager: AuthManager,
@@ -72,19 +159,48 @@ class FileHandler(BaseHandler):
         self.auth_manager: AuthManager = auth_manager
         self.auth_middleware: AuthMiddleware = auth_middleware
         self.permission: Permission = permission
-        self.system_logger: Logger = get_system_logger(__name__)
+        self.system_logger: Logger = LOG
         self.stats_manager: StatsManager = stats_manager
-        self.data: Dict[str, Any] = load_json(self.settings.doc_meta_path)
+        self._data_cache: Optional[Dict[str, Dict[str, List[Dict[str, str]]]]] = None
+        self._data_mtime: Optional[int] = None
+        self._data_lock: threading.Lock = threading.Lock()
         self._common_documents: Dict[str, Any] = load_json(str(Path(f"{self.settings.templates_dir}/file/documents.json")))
         self._common_template: str = load_txt(str(Path(f"{self.settings.templates_dir}/file/template.txt")))
-        self._file_pattern: str = r"^[A-Z]{2}-[A-Z]{2}-\d{2}$"
+        self._common_codes_cached: str = self._build_common_codes()
+
+    @property
+    def data(self) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
+        """
+        Returns the document index, loading it from disk when needed.
+
+        The index is parsed on first access and parsed again whenever the modification
+        time of `doc_meta_path` changes, so a new synchronization is picked up without
+        restarting the bot.
+
+        Returns:
+            Dict[str, Dict[str, List[Dict[str, str]]]]: The document index nested by code group.
+        """
+        path = self.settings.doc_meta_path
+        try:
+            mtime: Optional[int] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if self._data_cache is None or mtime != self._data_mtime:
+            with self._data_lock:
+                if self._data_cache is None or mtime != self._data_mtime:
+                    self._data_cache = _build_document_index(load_json(path))
+                    self._data_mtime = mtime
+                    LOG.debug("File - Document index loaded (%d groups)", len(self._data_cache))
+
+        return self._data_cache
 
     async def handle_message(self, turn_context: TurnContext) -> Optional[Union[str, Attachment]]:
         """
         Processes an incoming user message to handle file lookup requests.
 
-        This method validates user permissions, checks command format, and 
-        retrieves the corresponding documents from the JSON index.
+        This method checks the command prefix, validates user permissions, checks
+        command format, and retrieves the corresponding documents from the JSON index.
 
         Args:
             turn_context (TurnContext): The Bot Framework turn context.
@@ -96,6 +212,13 @@ class FileHandler(BaseHandler):
         if not self.enabled:
             return None
 
+        message = (self._get_user_message(turn_context) or "").strip()
+
+        # Cheap prefix check first, so messages for other handlers skip authentication.
+        # Uses the router's token rule: "/file" and "/file?" match, "/files" does not.
+        if not self._matches_command(message):
+            return None
+
         is_authorized, error_msg = await self.auth_middleware.process_message(
             turn_context,
             self.permission
@@ -103,39 +226,48 @@ class FileHandler(BaseHandler):
         if not is_authorized:
             return error_msg
 
-        message = self._get_user_message(turn_context)
+        # Skip the rest of the command token, as split() did ("/file?" lists the common codes)
+        rest = message[_token_end(message, self._cmd_token_len):].lstrip()
+
+        # Comandos comunes con /file
+        if not rest:
+            return self._common_codes()
+
+        # Busqueda de archivos
+        else:
+            command = rest[:_token_end(rest)]
 
-        if message.strip().startswith(f"/{self.prefix}"):
-            parts = message.strip().split(maxsplit=2)
+            code = command.upper()
+            if _is_valid_code(code):
+                user_info = self.auth_middleware.get_user_info(turn_context)
+                start_time = time.perf_counter()
+                response, success  = self._search_documents(code)
+                duration_ms = (time.perf_counter() - start_time) * 1000
 
-            # Comandos comunes con /file
-            if len(parts) < 2:
-                return self._common_codes()
+                # Only enqueues the row; StatsManager's background writer does the disk I/O
+                self.stats_manager.log(
+                user_info, self.prefix, self.name, None, duration_ms, "success" if success else "error"
+                )
 
-            # Busqueda de archivos
+                return response 
+            
             else:
-                command = parts[1]
-                args = parts[2] if len(parts) > 2 else ""
+                return _INVALID_CODE_TMPL.format(command=command)
 
-                if re.match(self._file_pattern, command.upper().strip()):
-                    code = command.upper().strip()
-                    user_info = self.auth_middleware.get_user_info(turn_context)
-                    start_time = time.time()
-                    response, success  = self._search_documents(code)
-                    duration_ms = (time.time() - start_time) * 1000
+    def _common_codes(self) -> str:
+        """
+        Returns the list of frequently used document codes.
 
-                    self.stats_manager.log(
-                    user_info, f"{self.prefix}", self.name, None, duration_ms, "success" if success else "error"
-                    )
+        The message is built once at construction time by `_build_common_codes`.
 
-                    return response 
-                
-                else:
-                    return f"Formato de código no válido: {command}. Ejemplo: FR-GC-01"
+        Returns:
+            str: A formatted string containing the list of common documents.
+        """
+        return self._common_codes_cached
 
-    def _common_codes(self) -> str:
+    def _build_common_codes(self) -> str:
         """
-        Formats and returns a list of frequently used document codes from a JSON index.
+        Formats a list of frequently used document codes from a JSON index.
 
         This method generates a user-friendly, Markdown-formatted message
         that lists common document codes, their names, and descriptions.
@@ -156,7 +288,7 @@ class FileHandler(BaseHandler):
 
         # Join the list into a single string
         documents_list_str = "\n\n".join(documents_list)
-        print(documents_list_str)
+        LOG.debug("File - Common documents list built (%d docs)", len(documents_list))
 
         # Format the template with the data
         return template.format(
@@ -174,32 +306,30 @@ class FileHandler(BaseHandler):
         associated documents. It handles cases where no documents are found for the code.
 
         Args:
-            code (str): The document code to search for (e.g., "FR-GC-01").
+            code (str): The document code to search for (e.g., "FR-GC-01"), already validated.
 
         Returns:
             Tuple[str, bool]: A tuple containing:
                 - A plain text message with the search results, including document names and links.
                 - A boolean value indicating if any documents were found (True) or not (False).
         """
-        self.system_logger.debug(f"File - User: Search document with code {code}")
+        LOG.debug("File - User: Search document with code %s", code)
 
-        docs: List[Dict[str, str]] = self.data.get(code, [])
+        docs: List[Dict[str, str]] = self.data.get(code[:5], _EMPTY_GROUP).get(code[6:], _EMPTY_DOCS)
 
         if not docs:
-            self.system_logger.debug(f"File - Response: Not found document with code {code}")
-            return f"No se encontraron documentos para el código `{code}`.", False
-
-        header = f"🔎 Se {'encontraron' if len(docs) > 1 else 'encontro'} {len(docs)} documento{'s' if len(docs) > 1 else ''} para el código `{code}`:\n\n"
+            LOG.debug("File - Response: Not found document with code %s", code)
+            return _NOT_FOUND_TMPL.format(code=code), False
 
-        doc_list = []
-        for doc in docs:
-            name = doc.get('name', 'Unnamed')
-            url = doc.get('webUrl', '#')
-            doc_list.append(f"- **{name}** [Descargar]({url})\n")
+        count = len(docs)
+        plural = count > 1
+        header = f"🔎 Se {'encontraron' if plural else 'encontro'} {count} documento{'s' if plural else ''} para el código `{code}`:\n\n"
 
-        self.system_logger.debug(f"File - Response: Found document with code {code}")
+        LOG.debug("File - Response: Found document with code %s", code)
 
-        return header + "\n".join(doc_list), True
+        return header + "\n".join(
+            f"- **{doc.get('name', 'Unnamed')}** [Descargar]({doc.get('webUrl', '#')})\n" for doc in docs
+        ), True
 
     def can_handle(self, message: str, context: Dict[str, Any] = None) -> bool:
         """
@@ -212,7 +342,7 @@ class FileHandler(BaseHandler):
         Returns:
             bool: True if the message starts with the prefix, otherwise False.
         """
-        return message.strip().lower().startswith(f"/{self.prefix}")
+        return self._matches_command(message)
     
     def get_help(self) -> Dict[str, Any]:
         """
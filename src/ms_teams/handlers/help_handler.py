@@ -1,11 +1,16 @@
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple, FrozenSet, Callable
 from botbuilder.core import TurnContext
 
 from src.ms_teams.handlers.base_handler import BaseHandler
-from src.auth.manager import AuthManager, Permission
+from src.auth.manager import AuthManager
 from src.auth.middleware import AuthMiddleware
 
+# Handlers left out of the general help
+_HIDDEN_NAMES: FrozenSet[str] = frozenset({"help", "echo"})
+
+_ERR_PREFIX: str = "❌ **Error:** "
+
 class HelpHandler(BaseHandler):
     """
     Manages and provides help information to the user.
@@ -22,6 +27,18 @@ class HelpHandler(BaseHandler):
     Attributes:
         auth_manager (AuthManager): The manager responsible for user authentication.
         auth_middleware (AuthMiddleware): The middleware for handling authorization.
+        handlers (Dict[str, Dict]): Handler information dictionaries keyed by command prefix.
+        _merged_help (Dict[str, Tuple[str, str, List[str], List[Dict]]]): Per handler prefix, the
+            displayed prefix, general explanation, functionalities and commands, merged from the
+            configuration metadata and the handler's `get_help()`.
+        _specific_cache (Optional[Dict[str, str]]): Rendered specific help keyed by handler prefix,
+            or None until it is built on first use or after `invalidate`.
+        _general_entries (Tuple[Tuple[Optional[str], str], ...]): (required permission, prefix) pairs
+            of the handlers listed in the general help, in configuration order.
+        _general_cache (Dict[FrozenSet[str], str]): Rendered general help keyed by permission set.
+        _dispatch (Dict[int, Callable[[List[str], FrozenSet[str]], str]]): Help builders keyed by the
+            number of tokens in a "/{prefix}" command.
+        _err_suffix (str): Closing sentence of every error message, built once from the prefix.
     """
 
     def __init__(
@@ -49,6 +66,57 @@ class HelpHandler(BaseHandler):
         self.auth_manager: AuthManager = auth_manager
         self.auth_middleware: AuthMiddleware = auth_middleware
         self.handlers: Dict[str, Dict] = handlers
+        self._merged_help: Dict[str, Tuple[str, str, List[str], List[Dict]]] = {}
+        self._specific_cache: Optional[Dict[str, str]] = None
+        self._general_entries: Tuple[Tuple[Optional[str], str], ...] = ()
+        self._general_cache: Dict[FrozenSet[str], str] = {}
+        self._err_suffix: str = f"\n\nType `/{self.prefix}` for a list of available commands."
+        self._dispatch: Dict[int, Callable[[List[str], FrozenSet[str]], str]] = {
+            1: self._handle_general,
+            2: self._handle_specific,
+        }
+
+    def refresh(self) -> None:
+        """
+        Renders the help of every handler and resets the general help cache.
+
+        Handler instances are attached to `handlers` after this handler is built, so the
+        cache is filled on first use, and again after `invalidate` whenever the handler
+        registry changes.
+        """
+        self._merged_help = {
+            handler_prefix: self._merge_help(handler_info)
+            for handler_prefix, handler_info in self.handlers.items()
+        }
+        self._specific_cache = {
+            handler_prefix: self._generate_specific_help(handler_prefix)
+            for handler_prefix in self._merged_help
+        }
+        self._general_entries = tuple(
+            (handler_info.get("permission"), handler_prefix)
+            for handler_prefix, handler_info in self.handlers.items()
+            if handler_info.get("name") not in _HIDDEN_NAMES
+        )
+        self._general_cache = {}
+
+    def invalidate(self) -> None:
+        """
+        Discards the rendered help so it is rebuilt from the current handlers on next use.
+
+        Registered as a `HandlerRegistry` change listener.
+        """
+        self._specific_cache = None
+
+    def _get_specific_cache(self) -> Dict[str, str]:
+        """
+        Returns the rendered specific help, building it on first use.
+
+        Returns:
+            Dict[str, str]: Rendered specific help keyed by handler prefix.
+        """
+        if self._specific_cache is None:
+            self.refresh()
+        return self._specific_cache
     
     async def handle_message(self, turn_context: TurnContext) -> str:
         """
@@ -69,33 +137,53 @@ class HelpHandler(BaseHandler):
             return error_msg
         
         user_info = self.auth_middleware.get_user_info(turn_context)
-        permissions = user_info["permissions"] if user_info else []
+        # Set of permission values, so every membership test below is O(1)
+        permissions: FrozenSet[str] = frozenset(user_info["permissions"]) if user_info else frozenset()
         message = self._get_user_message(turn_context).strip().lower()
 
-        parts = message.split()
-        content = ""
+        # At most "/<prefix> <command> <rest>" is needed to tell the cases apart
+        parts = message.split(None, 2)
 
-        # Check for general help command
-        if len(parts) == 1 and parts[0] == f"/{self.prefix}":
-            content = self._generate_general_help(permissions)
-        
-        # Check for specific help command
-        elif len(parts) == 2 and parts[0] == f"/{self.prefix}":
-            handler_prefix = parts[1]
-            if handler_prefix in self.handlers:
-                handler_info = self.handlers[handler_prefix]
-                required_permission = handler_info.get("permission")
-                if required_permission is None or required_permission in permissions:
-                    content = self._generate_specific_help(handler_info)
-                else:
-                    content = self._generate_error_help(handler_prefix, "No tienes permiso para acceder a información de este comando.")
-            else:
-                content = self._generate_error_help(handler_prefix)
-              
-        else:
-            content = self._generate_error_help(message)
+        # "/<prefix>" gives the general help and "/<prefix> <command>" the specific one
+        handler = self._dispatch.get(len(parts)) if parts and parts[0] == self._cmd_token_lower else None
+        if handler is None:
+            return self._generate_error_help(message)
 
-        return content
+        return handler(parts, permissions)
+
+    def _handle_general(self, parts: List[str], permissions: FrozenSet[str]) -> str:
+        """
+        Answers a "/{prefix}" command with the general help.
+
+        Args:
+            parts (List[str]): The command tokens.
+            permissions (FrozenSet[str]): The values of the user's permissions.
+
+        Returns:
+            str: The general help string.
+        """
+        return self._generate_general_help(permissions)
+
+    def _handle_specific(self, parts: List[str], permissions: FrozenSet[str]) -> str:
+        """
+        Answers a "/{prefix} <command>" command with the help of that handler.
+
+        Args:
+            parts (List[str]): The command tokens, the second one being the handler prefix.
+            permissions (FrozenSet[str]): The values of the user's permissions.
+
+        Returns:
+            str: The specific help string, or an error message if the handler does not
+                 exist or the user lacks its permission.
+        """
+        handler_prefix = parts[1]
+        if (handler_info := self.handlers.get(handler_prefix)) is None:
+            return self._generate_error_help(handler_prefix)
+
+        required_permission = handler_info.get("permission")
+        if required_permission is None or required_permission in permissions:
+            return self._get_specific_cache()[handler_prefix]
+        return self._generate_error_help(handler_prefix, "No tienes permiso para acceder a información de este comando.")
 
     def can_handle(self, message: str, context: Dict[str, Any] = None) -> bool:
         """
@@ -111,24 +199,25 @@ class HelpHandler(BaseHandler):
         Returns:
             bool: `True` if the message is a valid help command, `False` otherwise.
         """
-        return message.strip().lower().startswith(f"/{self.prefix}")
+        return self._matches_command(message)
 
-    def _generate_specific_help(self, handler_info: Dict[str, Any]) -> str:
+    @staticmethod
+    def _merge_help(handler_info: Dict[str, Any]) -> Tuple[str, str, List[str], List[Dict]]:
         """
-        Generates the help content for a specific handler.
+        Merges the help data of a handler instance with its configuration metadata.
 
-        This method extracts help data from a handler instance or its info dictionary,
-        and formats it into a readable string.
+        Values from the configuration metadata take precedence over those returned by
+        the handler's `get_help()`.
 
         Args:
             handler_info (Dict[str, Any]): The handler's information dictionary, containing
                                            the instance, prefix, and other data.
 
         Returns:
-            str: The formatted help string for the specific handler.
+            Tuple[str, str, List[str], List[Dict]]: The handler prefix, general explanation,
+                                                    functionalities and commands.
         """
         handler_instance: BaseHandler = handler_info.get("instance")
-        handler_prefix: str = handler_info.get("prefix")
         
         help_data = {}
         if handler_instance:
@@ -136,50 +225,71 @@ class HelpHandler(BaseHandler):
 
         metadata: Dict = handler_info.get("metadata", {}) 
 
-        general_explanation = metadata.get("general_explanation", help_data.get('general_explanation', 'Not available.'))
-        functionalities_list = metadata.get("functionality", help_data.get('functionality', []))
-        commands_list = metadata.get("commands",help_data.get('commands', []))
+        return (
+            handler_info.get("prefix"),
+            metadata.get("general_explanation", help_data.get('general_explanation', 'Not available.')),
+            metadata.get("functionality", help_data.get('functionality', [])),
+            metadata.get("commands",help_data.get('commands', [])),
+        )
+
+    def _generate_specific_help(self, handler_key: str) -> str:
+        """
+        Generates the help content for a specific handler.
+
+        This method formats the merged help data of the handler into a readable string.
+
+        Args:
+            handler_key (str): The handler's key in `handlers`, i.e. its command prefix.
+
+        Returns:
+            str: The formatted help string for the specific handler.
+        """
+        handler_prefix, general_explanation, functionalities_list, commands_list = self._merged_help[handler_key]
         
-        section = f"**Comando: /{handler_prefix}**\n\n"
-        section += f"**Descripción General:** {general_explanation}\n\n"
+        parts: List[str] = [
+            "**Comando: /", handler_prefix, "**\n\n**Descripción General:** ", general_explanation, "\n\n"
+        ]
         
         if functionalities_list:
-            functionalities = "\n".join([f"- {func}" for func in functionalities_list])
-            section += f"**Funcionalidades:**\n{functionalities}\n\n"
+            parts.append("**Funcionalidades:**\n")
+            parts.append("\n".join(f"- {func}" for func in functionalities_list))
+            parts.append("\n\n")
         
         if commands_list:
-            commands = [f"- **Uso:** `{cmd['use']}` **Descripción:** {cmd['description']}" for cmd in commands_list]
-            section += f"**Comandos:**\n" + "\n".join(commands)
+            parts.append("**Comandos:**\n")
+            parts.append("\n".join(
+                f"- **Uso:** `{cmd['use']}` **Descripción:** {cmd['description']}" for cmd in commands_list
+            ))
         
-        return section
+        return "".join(parts)
     
-    def _generate_general_help(self, permissions: List[Permission]) -> str:
+    def _generate_general_help(self, permissions: FrozenSet[str]) -> str:
         """
         Generates the content for the general help message, listing all
         available commands the user has permission to see.
 
+        The message is assembled from the cached specific help and memoized per
+        permission set, so users sharing a role reuse the same string.
+
         Args:
-            permissions (List[Permission]): The user's permissions.
+            permissions (FrozenSet[str]): The values of the user's permissions.
 
         Returns:
             str: The formatted general help string.
         """
-        help_sections = []
-        for _, handler_info in self.handlers.items():
-            handler_permission = handler_info.get("permission")
-            handler_name = handler_info.get("name")
-            
-            if handler_name in ["help", "echo"]:
-                continue
-
-            if handler_permission is None or handler_permission in permissions:
-                section = self._generate_specific_help(handler_info)
-                help_sections.append(section)
-
-        if not help_sections:
-            return "No hay comandos disponibles."
+        specific_cache = self._get_specific_cache()
+
+        content = self._general_cache.get(permissions)
+        if content is None:
+            help_sections = [
+                specific_cache[handler_prefix]
+                for handler_permission, handler_prefix in self._general_entries
+                if handler_permission is None or handler_permission in permissions
+            ]
+            content = "\n\n---\n\n".join(help_sections) if help_sections else "No hay comandos disponibles."
+            self._general_cache[permissions] = content
 
-        return "\n\n---\n\n".join(help_sections)
+        return content
     
     def _generate_error_help(self, command: str, reason: str = None) -> str:
         """
@@ -192,10 +302,8 @@ class HelpHandler(BaseHandler):
         Returns:
             str: The formatted error message.
         """
-        if reason:
-            return f"❌ **Error:** {reason}\n\nType `/{self.prefix}` for a list of available commands."
-        else:
-            return f"❌ **Error:** Command `/{self.prefix} {command}` not found.\n\nType `/{self.prefix}` for a list of available commands."
+        # Only the not-found branch depends on the user's input
+        return _ERR_PREFIX + (reason if reason else f"Command `/{self.prefix} {command}` not found.") + self._err_suffix
 
 
     def get_help(self) -> Dict[str, Any]:
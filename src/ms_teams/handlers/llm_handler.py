@@ -1,10 +1,13 @@
 import time
+import string
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, FrozenSet
 from pathlib import Path
 from botbuilder.core import TurnContext
 from logging import Logger
 
+from cachetools import LRUCache
+
 from src.ms_teams.handlers.base_handler import BaseHandler
 from src.auth.manager import AuthManager, Permission
 from src.auth.middleware import AuthMiddleware
@@ -15,9 +18,12 @@ from src.lang_chain.memory_manager import MemoryManager
 from src.open_ai.client import OpenAIClient
 from src.log.system_logger import Logger, get_system_logger
 from src.config.settings import Settings, get_settings
-from src.utils.txt import load_txt
+from src.utils.txt import load_txt_files
 from src.ms_teams.handlers.utils import extract_response
 
+# Maximum number of per-user LLM runnables kept in memory
+LLM_USER_CACHE_SIZE: int = 1000
+
 class LLMHandler(BaseHandler):
     """
     Manages interactions with a Large Language Model (LLM) for general messaging
@@ -41,10 +47,16 @@ class LLMHandler(BaseHandler):
         prefix (str): The command prefix used to trigger this handler, e.g., "llm".
         permission (Permission): The required permission level for a user to access this handler.
         system_logger (Logger): A logger for system events and diagnostics.
-        user_llm_models (Dict[str, OpenAIBase]): A dictionary to store the LLM model instance for each user.
+        user_llm_models (LRUCache): The LLM runnable of each user, keeping the `LLM_USER_CACHE_SIZE` most
+            recently active users. Conversation history lives in `memory_manager`, so an evicted user
+            simply gets a new runnable over the same history.
         openai_client (OpenAIClient): The client for interacting with the OpenAI API.
         commands (Dict[str, Callable]): A map of command strings to their corresponding methods.
         prompt_templates (Dict[str, str]): A dictionary of pre-loaded prompt templates for specialized commands.
+        _template_parts (Dict[str, Optional[Tuple[str, str]]]): For each template, the text before and after
+            its single `{message}` field, or None if the template needs `str.format`.
+        _llm_wrapper (OpenAIChatWrapper): LangChain wrapper around `openai_client`, shared by all users.
+        _tools (List[Dict[str, Any]]): Tool definitions bound to every user's runnable.
         memory_manager (MemoryManager): Manages shared conversation memory for all user models.
         stats_manager (StatsManager): Manages the logging of usage statistics.
     """
@@ -85,15 +97,22 @@ class LLMHandler(BaseHandler):
         self.auth_middleware: AuthMiddleware = auth_middleware
         self.permission: Permission = permission
         self.system_logger: Logger = get_system_logger(__name__)
-        self.user_llm_models: Dict[str, OpenAIChatRunnable] = {}
+        self.user_llm_models: LRUCache = LRUCache(maxsize=LLM_USER_CACHE_SIZE)
         self.stats_manager: StatsManager = stats_manager
         self.memory_manager: MemoryManager = memory_manager
         self._templates_dir: str = templates_dir if templates_dir else str(Path(self.settings.templates_dir) / "llm")
         self._instructions_file: str = instructions_file if instructions_file else "_instructions.txt"
+
+        # Instructions and command templates are read from the templates directory in one pass
+        templates: Dict[str, str] = load_txt_files(
+            self._templates_dir,
+            [self._instructions_file, "translate.txt", "medic.txt", "email.txt"]
+        )
+
         self.openai_client = OpenAIClient(
             api_key=self.settings.openai_api_key,
             model=self.settings.openai_model_name,
-            instructions=load_txt(str(Path(self._templates_dir) / self._instructions_file)),
+            instructions=templates[self._instructions_file],
             tools=None,
             temperature=self.settings.llm_temperature,
             max_output_tokens=self.settings.llm_max_output_tokens)
@@ -103,12 +122,72 @@ class LLMHandler(BaseHandler):
             "medic": self._cmd_medic,
             "email": self._cmd_email
         }
+        self._command_set: FrozenSet[str] = frozenset(self.commands)
+
+        # Strings that only depend on the prefix
+        self._incomplete_command_msg: str = f"Comando incompleto. Uso: /{self.prefix} <comando> [argumentos]"
+        self._stats_event: str = self.prefix
+        self._stats_command_event: str = f"{self.prefix}_command"
 
         self.prompt_templates = {
-            "translate": load_txt(str(Path(self._templates_dir) / "translate.txt")),
-            "medic": load_txt(str(Path(self._templates_dir) / "medic.txt")),
-            "email": load_txt(str(Path(self._templates_dir) / "email.txt"))
+            "translate": templates["translate.txt"],
+            "medic": templates["medic.txt"],
+            "email": templates["email.txt"]
         }
+        self._template_parts: Dict[str, Optional[Tuple[str, str]]] = {
+            template_key: self._split_template(template)
+            for template_key, template in self.prompt_templates.items()
+        }
+
+        # The wrapper only reads its configuration on each call, so one instance serves every user
+        self._llm_wrapper: OpenAIChatWrapper = OpenAIChatWrapper(client=self.openai_client)
+        self._tools: List[Dict[str, Any]] = [
+            OpenAIClient.tool_web_search()
+        ]
+
+    @staticmethod
+    def _split_template(template: str) -> Optional[Tuple[str, str]]:
+        """
+        Splits a prompt template around its `{message}` field.
+
+        Filling the template then only takes two concatenations instead of a
+        `str.format` call, which parses the template every time.
+
+        Args:
+            template (str): The prompt template.
+
+        Returns:
+            Optional[Tuple[str, str]]: The (already unescaped) text before and after the field, or
+                                       None if the template has no `{message}` field, has it more
+                                       than once, or has any other field.
+        """
+        head: List[str] = []
+        tail: List[str] = []
+        found = False
+        try:
+            for literal_text, field_name, format_spec, conversion in string.Formatter().parse(template):
+                (tail if found else head).append(literal_text)
+                if field_name is None:
+                    continue
+                if found or field_name != "message" or format_spec or conversion:
+                    return None
+                found = True
+        except ValueError:
+            # Malformed template: leave the error to str.format, as before
+            return None
+        return ("".join(head), "".join(tail)) if found else None
+
+    def _history_getter(self, session_id: str):
+        """
+        Returns the conversation history of a session from the shared memory manager.
+
+        Args:
+            session_id (str): The session identifier, i.e. the user's ID.
+
+        Returns:
+            The message history for the session.
+        """
+        return self.memory_manager.get_history_for_user(session_id)
 
     async def _get_llm_model_for_user(self, user_info: Dict) -> OpenAIChatRunnable:
         """
@@ -128,28 +207,22 @@ class LLMHandler(BaseHandler):
         user_id = user_info['user_id']
         user_name = user_info['name']
 
-        if user_id not in self.user_llm_models:
+        # The creation path has no await, so no other coroutine can interleave between
+        # the lookup and the insert; setdefault keeps a single runnable per user regardless
+        runnable = self.user_llm_models.get(user_id)
+        if runnable is None:
             self.system_logger.debug(f"Creating new OpenAIChatRunnable for user: {user_name}")
 
-            llm = OpenAIChatWrapper(client=self.openai_client)
-
-            def history_getter(session_id: str):
-                return self.memory_manager.get_history_for_user(session_id)
-            
-            tools = [
-                OpenAIClient.tool_web_search()
-            ]
-
             runnable = OpenAIChatRunnable(
-                llm=llm,
-                history_getter=history_getter,
-                tools=tools,
+                llm=self._llm_wrapper,
+                history_getter=self._history_getter,
+                tools=self._tools,
                 system_instructions=self.openai_client.instructions,
             )
 
-            self.user_llm_models[user_id] = runnable
+            runnable = self.user_llm_models.setdefault(user_id, runnable)
 
-        return self.user_llm_models[user_id]
+        return runnable
 
     async def handle_message(self, turn_context: TurnContext) -> Optional[str]:
         """
@@ -181,57 +254,47 @@ class LLMHandler(BaseHandler):
 
         message = self._get_user_message(turn_context).strip()
 
-        if message.startswith(f"/{self.prefix}"):
+        # Single tokenization pass: "/<prefix> <command> <args>" or "/<command> <args>"
+        parts = message.split(maxsplit=2)
+        head = parts[0].lower() if parts else ""
 
-            parts = message.split(maxsplit=2)
+        if head == self._cmd_token_lower:
             if len(parts) < 2:
-                return f"Comando incompleto. Uso: /{self.prefix} <comando> [argumentos]"
+                return self._incomplete_command_msg
             
             command = parts[1].lower()
-            args = parts[2] if len(parts) > 2 else ""
+            if command in self._command_set:
+                return await self._execute_command(command, parts[2] if len(parts) > 2 else "", turn_context)
+            return await self._dispatch_general(turn_context, message[self._cmd_token_len:].strip())
 
-            if command in self.commands:
-                return await self._execute_command(command, args, turn_context)
-            else:
-                user_info = self.auth_middleware.get_user_info(turn_context)
-                start_time = time.time()
-                response = await self._process_message(turn_context, message.removeprefix(f"/{self.prefix}").strip())
-                response = response if response else ""
-                duration_ms = (time.time() - start_time) * 1000
-                self.stats_manager.log(
-                user_info, f"{self.prefix}", self.name, None, duration_ms, "success"
-                )
-                return extract_response(response)
-
-        elif message.startswith("/"):
-            parts = message.split(maxsplit=1)
-
-            command = parts[0].removeprefix("/").lower()
-            args = parts[1] if len(parts) > 1 else ""
-
-            if command in self.commands:
-                return await self._execute_command(command, args, turn_context)
-            else:
-                user_info = self.auth_middleware.get_user_info(turn_context)
-                start_time = time.time()
-                response = await self._process_message(turn_context, message.strip("/"))
-                response = response if response else ""
-                duration_ms = (time.time() - start_time) * 1000
-                self.stats_manager.log(
-                user_info, f"{self.prefix}", self.name, None, duration_ms, "success"
-                )
-                return extract_response(response)
-
-        else:
-            user_info = self.auth_middleware.get_user_info(turn_context)
-            start_time = time.time()
-            response = await self._process_message(turn_context, message)
-            response = response if response else ""
-            duration_ms = (time.time() - start_time) * 1000
-            self.stats_manager.log(
-            user_info, f"{self.prefix}", self.name, None, duration_ms, "success"
-            )
-            return extract_response(response)
+        elif head.startswith("/"):
+            command = head[1:]
+            if command in self._command_set:
+                return await self._execute_command(command, message[len(head):].lstrip(), turn_context)
+            return await self._dispatch_general(turn_context, message.strip("/"))
+
+        return await self._dispatch_general(turn_context, message)
+
+    async def _dispatch_general(self, turn_context: TurnContext, message: str) -> str:
+        """
+        Sends a general, non-command message to the LLM and records its usage statistics.
+
+        Args:
+            turn_context (TurnContext): The Bot Framework turn context.
+            message (str): The message to send, without any command prefix.
+
+        Returns:
+            str: The text of the LLM response.
+        """
+        user_info = self.auth_middleware.get_user_info(turn_context)
+        start_ns = time.perf_counter_ns()
+        response = await self._process_message(turn_context, message)
+        response = response if response else ""
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        self.stats_manager.log(
+            user_info, self._stats_event, self.name, None, duration_ms, "success"
+        )
+        return extract_response(response)
 
     async def _execute_command(self, command: str, args: str, turn_context: TurnContext) -> str:
         """
@@ -249,21 +312,22 @@ class LLMHandler(BaseHandler):
             str: The response from the executed command, or an error message if
                  the command fails.
         """
+        # Resolved before the try block so the error branch can always log them
+        user_info = self.auth_middleware.get_user_info(turn_context)
+        start_ns = time.perf_counter_ns()
         try:
-            user_info = self.auth_middleware.get_user_info(turn_context)
-            start_time = time.time()
             response = await self.commands[command](args, turn_context)
             response = response if response else ""
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             self.stats_manager.log(
-                user_info, f"{self.prefix}_command", self.name, command, duration_ms, "success"
+                user_info, self._stats_command_event, self.name, command, duration_ms, "success"
             )
             return extract_response(response)
         
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             self.stats_manager.log(
-                user_info, f"{self.prefix}_command", self.name, command, duration_ms, "error"
+                user_info, self._stats_command_event, self.name, command, duration_ms, "error"
             )
             self.system_logger.error(f"Error executing command '{command}': {e}", exc_info=True)
             return f"Error ejecutando comando '{command}': {str(e)}"
@@ -343,8 +407,6 @@ class LLMHandler(BaseHandler):
             self.system_logger.error(f"Prompt template '{template_key}' not found.")
             return "Error interno: template de prompt no configurado."
         
-        message_for_llm = prompt_template.format(message=user_input)
-
         try:
             user_info = self.auth_middleware.get_user_info(turn_context)
             if not user_info:
@@ -355,6 +417,12 @@ class LLMHandler(BaseHandler):
                 f"Input: {user_input}"
             )
 
+            template_parts = self._template_parts.get(template_key)
+            if template_parts:
+                message_for_llm = template_parts[0] + user_input + template_parts[1]
+            else:
+                message_for_llm = prompt_template.format(message=user_input)
+
             llm_response = await self._create_response(message_for_llm, user_info)
 
             self.system_logger.debug(
@@ -475,24 +543,8 @@ class LLMHandler(BaseHandler):
             bool: `True` if the message is not a command for another handler,
                 otherwise `False`.
         """
-        return message.strip().lower().startswith(f"/{self.prefix}")
+        return self._matches_command(message)
 
-    @staticmethod
-    def _list_to_string_with_spaces(string_list: list) -> str:
-        """
-        Converts a list of strings into a single, space-separated string.
-
-        Args:
-            string_list (list): A list of strings.
-
-        Returns:
-            str: A single string with all list elements joined by spaces.
-                Returns an empty string if the input is not a list or is empty.
-        """
-        if not isinstance(string_list, list):
-            return ""
-        return "".join(string_list)
-    
     def get_help(self) -> Dict[str, Any]:
         """
         Returns a detailed help dictionary for the LLMHandler.
@@ -374,7 +374,7 @@ class RAGHandler(BaseHandler):
             bool: `True` if the message can be handled by this handler,
                 otherwise `False`.
         """
-        return message.strip().lower().startswith(f"/{self.prefix}")
+        return self._matches_command(message)
     
     def get_help(self) -> Dict[str, Any]:
         """
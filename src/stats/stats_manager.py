@@ -1,9 +1,137 @@
 import csv
+import queue
+import atexit
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from datetime import datetime
 from src.log.system_logger import Logger, get_system_logger
 
+# Buffered rows are written every FLUSH_INTERVAL seconds or as soon as FLUSH_BATCH_SIZE accumulate
+FLUSH_INTERVAL: float = 0.5
+FLUSH_BATCH_SIZE: int = 64
+
+class _StatsWriter:
+    """
+    Background writer appending statistics rows to a single CSV file.
+
+    One writer exists per file, shared by every `StatsManager` pointing at it, so rows
+    from all managers go through one queue and one thread. Once closed, rows are written
+    synchronously instead of being queued.
+
+    Attributes:
+        file_path (Path): The path to the CSV file where statistics are stored.
+        system_logger (Logger): A logger for internal system events and diagnostics.
+        _queue (queue.Queue): Rows waiting to be written to the statistics file.
+        _lock (threading.Lock): Orders submissions against `close`, so no row is queued after the thread exits.
+        _closed (bool): Whether the writer has been closed.
+        _thread (threading.Thread): Background thread that flushes the queued rows.
+    """
+    def __init__(self, file_path: Path):
+        """
+        Initializes the writer and starts its background thread.
+
+        Args:
+            file_path (Path): The path to the CSV file where statistics are stored.
+        """
+        self.file_path: Path = file_path
+        self.system_logger: Logger = get_system_logger(__name__)
+        self._queue: queue.Queue = queue.Queue()
+        self._lock: threading.Lock = threading.Lock()
+        self._closed: bool = False
+        self._thread: threading.Thread = threading.Thread(target=self._run, name="stats-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, row: List[str]) -> None:
+        """
+        Queues a row for the background thread, or writes it directly if the writer is closed.
+
+        Args:
+            row (List[str]): The row to write.
+        """
+        with self._lock:
+            if not self._closed:
+                self._queue.put(row)
+                return
+        self.write_rows([row])
+
+    def _run(self) -> None:
+        """
+        Background loop that drains the queue and appends the rows to the statistics file.
+
+        Waits up to `FLUSH_INTERVAL` seconds for a row, then collects up to `FLUSH_BATCH_SIZE`
+        rows and writes them with a single file open. Exits once the writer is closed and
+        the queue is empty.
+        """
+        while not (self._closed and self._queue.empty()):
+            try:
+                rows: List[List[str]] = [self._queue.get(timeout=FLUSH_INTERVAL)]
+            except queue.Empty:
+                continue
+
+            while len(rows) < FLUSH_BATCH_SIZE:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self.write_rows(rows)
+
+    def write_rows(self, rows: List[List[str]]) -> None:
+        """
+        Appends a batch of rows to the statistics file.
+
+        Args:
+            rows (List[List[str]]): The rows to write.
+        """
+        try:
+            with open(self.file_path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerows(rows)
+        except Exception as e:
+            self.system_logger.error(f"Error logging stats: {e}")
+
+    def close(self) -> None:
+        """
+        Stops the background thread after flushing any pending rows.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._thread.join()
+
+_WRITERS: Dict[Path, _StatsWriter] = {}
+_WRITERS_LOCK: threading.Lock = threading.Lock()
+
+def _get_writer(file_path: Path) -> _StatsWriter:
+    """
+    Returns the shared writer of a statistics file, creating it on first use.
+
+    Args:
+        file_path (Path): The path to the CSV file where statistics are stored.
+
+    Returns:
+        _StatsWriter: The writer shared by every manager of that file.
+    """
+    key: Path = file_path.resolve()
+    with _WRITERS_LOCK:
+        writer: Optional[_StatsWriter] = _WRITERS.get(key)
+        if writer is None:
+            writer = _StatsWriter(file_path)
+            _WRITERS[key] = writer
+        return writer
+
+@atexit.register
+def _close_writers() -> None:
+    """
+    Flushes and stops every statistics writer on interpreter shutdown.
+    """
+    with _WRITERS_LOCK:
+        writers: List[_StatsWriter] = list(_WRITERS.values())
+    for writer in writers:
+        writer.close()
+
 class StatsManager:
     """
     Manages the collection and storage of usage statistics.
@@ -20,10 +148,13 @@ class StatsManager:
         - Recording of key event details, including user information, handler name,
         command, duration, and status.
         - Centralized logging point to maintain consistent data format.
+        - Buffered writes: events are queued and appended in batches by a background
+        thread shared per file, keeping file I/O off the message handling path.
 
     Attributes:
         file_path (Path): The path to the CSV file where statistics are stored.
         system_logger (Logger): A logger for internal system events and diagnostics.
+        _writer (_StatsWriter): Background writer shared by every manager of the same file.
     """
     def __init__(self, file_path: str):
         """
@@ -38,6 +169,7 @@ class StatsManager:
         self.file_path:Path = Path(file_path)
         self.system_logger: Logger = get_system_logger(__name__)
         self._ensure_file_exists()
+        self._writer: _StatsWriter = _get_writer(self.file_path)
 
     def _ensure_file_exists(self):
         """
@@ -69,9 +201,11 @@ class StatsManager:
         """
         Logs a usage event to the statistics file.
 
-        This method appends a new row to the CSV file with details about a
+        This method queues a new row for the CSV file with details about a
         specific event, such as a message being processed or a command being
-        executed. It includes a timestamp and other relevant metrics.
+        executed. It includes a timestamp and other relevant metrics. The row
+        is written by the background writer, so this call never blocks on disk;
+        after `close` it is written synchronously instead.
 
         Args:
             user_info (Dict[str, Any]): A dictionary containing user-related
@@ -87,20 +221,24 @@ class StatsManager:
             status (str): The outcome of the event, either "success" or "error".
                         Defaults to "success".
         """
-        try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            with open(self.file_path, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    timestamp, 
-                    user_info.get("user_id", "unknown"),
-                    user_info.get("name", "unknown"),
-                    event_type,
-                    handler_name,
-                    command if command else "",
-                    f"{duration_ms:.2f}" if duration_ms is not None else "",
-                    status
-                ])
-        except Exception as e:
-            self.system_logger.error(f"Error logging stats: {e}")
\ No newline at end of file
+        self._writer.submit([
+            timestamp, 
+            user_info.get("user_id", "unknown"),
+            user_info.get("name", "unknown"),
+            event_type,
+            handler_name,
+            command if command else "",
+            f"{duration_ms:.2f}" if duration_ms is not None else "",
+            status
+        ])
+
+    def close(self) -> None:
+        """
+        Stops the background writer of this manager's file after flushing any pending rows.
+
+        Rows logged afterwards are written synchronously. All writers are also closed on
+        interpreter shutdown.
+        """
+        self._writer.close()
@@ -1,5 +1,6 @@
 import os
 import json
+import orjson
 from typing import Dict, Any
 
 from src.log.system_logger import Logger, get_system_logger
@@ -10,7 +11,7 @@ def load_json(file_path: str) -> Dict[str, Dict[str, Any]]:
     """
     Loads a dictionary from a JSON file.
 
-    This function safely attempts to read and parse a JSON file. If the file does not exist,
+    This function safely attempts to read and parse a JSON file with orjson. If the file does not exist,
     is not a valid JSON, or an unexpected error occurs, it handles the exception gracefully
     and returns an empty dictionary.
 
@@ -25,11 +26,12 @@ def load_json(file_path: str) -> Dict[str, Dict[str, Any]]:
         LOG.warning(f"Local file not found at '{file_path}'. Creating a new empty one.")
         return {}
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # orjson parses the raw UTF-8 bytes directly, several times faster than json.load
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
             LOG.debug(f"Loaded {len(data)} entries from '{file_path}'.")
             return data
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         LOG.error(f"Error decoding JSON from '{file_path}': {e}. Starting with an empty record.")
         return {}
     except Exception as e:
@@ -1,5 +1,7 @@
 import os
 
+from typing import Dict, List
+
 def load_txt(path:str):
     """
     Loads the content of a .txt file as a single string.
@@ -28,4 +30,36 @@ def load_txt(path:str):
     
     with open(path, "r", encoding="utf-8") as file:
         content = file.read()
-        return content
\ No newline at end of file
+        return content
+
+def load_txt_files(directory: str, file_names: List[str]) -> Dict[str, str]:
+    """
+    Loads several .txt files from the same directory in a single pass.
+
+    The directory is listed once with `os.scandir` and only the requested files
+    are read, instead of checking and opening each path separately.
+
+    Args:
+        directory (str): The directory containing the .txt files.
+        file_names (List[str]): The names of the files to load (e.g. "email.txt").
+
+    Returns:
+        Dict[str, str]: The content of each file, keyed by file name.
+
+    Raises:
+        FileNotFoundError: If the directory or one of the requested files does not exist.
+        ValueError: If one of the requested files does not have a .txt extension.
+    """
+    with os.scandir(directory) as entries:
+        paths: Dict[str, str] = {entry.name: entry.path for entry in entries if entry.is_file()}
+
+    contents: Dict[str, str] = {}
+    for file_name in file_names:
+        if not file_name.lower().endswith(".txt"):
+            raise ValueError("The file must have the extension .txt")
+        path = paths.get(file_name)
+        if path is None:
+            raise FileNotFoundError(f"The file '{os.path.join(directory, file_name)}' does not exist.")
+        with open(path, "r", encoding="utf-8") as file:
+            contents[file_name] = file.read()
+    return contents